@@ -1,4 +1,4 @@
-import io
+import inspect
 
 from silvair_uart_common_libs.messages import UartCommand, PingRequestMessage, PongResponseMessage, \
     InitDeviceEventMessage, \
@@ -11,7 +11,7 @@ from silvair_uart_common_libs.messages import UartCommand, PingRequestMessage, P
     DfuStatusRequestMessage, DfuStatusResponseMessage, DfuPageCreateRequestMessage, DfuPageCreateResponseMessage, \
     DfuWriteDataEventMessage, DfuPageStoreRequestMessage, DfuPageStoreResponseMessage, InvalidOpcode, InvalidLen, \
     DfuStateRequestMessage, DfuStateResponseMessage, DfuCancelRequestMessage, \
-    DfuCancelResponseMessage, StartTestRequest, StartTestResponse
+    DfuCancelResponseMessage, StartTestRequest, StartTestResponse, UART_LENGTH_LEN, UART_CMD_LEN
 
 UART_CLASSES = {
     UartCommand.PingRequest: PingRequestMessage,
@@ -57,6 +57,20 @@ UART_CLASSES = {
     UartCommand.DfuCancelResponse: DfuCancelResponseMessage
 }
 
+# UART_CLASSES keyed by raw int opcodes, so lookups with opcode read from a frame do not involve IntEnum members
+UART_CLASSES_BY_OPCODE = {int(cmd): msg_class for cmd, msg_class in UART_CLASSES.items()}
+
+UART_OPCODE_RANGE = 256
+
+# Hot path dispatch table: message class indexed directly by opcode, None for unsupported opcodes and abstract classes
+UART_DISPATCH = tuple(msg_class if msg_class is not None and not inspect.isabstract(msg_class) else None
+                      for msg_class in (UART_CLASSES_BY_OPCODE.get(opcode) for opcode in range(UART_OPCODE_RANGE)))
+
+# Shared instances of stateless messages indexed by opcode, None for messages which have to be created per frame
+_STATELESS_MESSAGES = tuple(msg_class() if msg_class is not None and msg_class._STATELESS else None
+                            for msg_class in UART_DISPATCH)
+
+
 def serialize_message(msg):
     """
     Serialize GenericMessage into bytes
@@ -64,29 +78,87 @@ def serialize_message(msg):
     :param msg:     GenericMessage or derivative, message to be serialized
     :return:        bytes, serialized message
     """
-    stream = io.BytesIO()
-    msg.serialize(stream)
-    return stream.getvalue()
+    return msg.serialize_to_bytes()
+
+
+def serialize_many(msgs):
+    """
+    Serialize GenericMessages into concatenated bytes, joined in single allocation
+
+    :param msgs:    iterable of GenericMessage or derivative, messages to be serialized
+    :return:        bytes, serialized messages
+    """
+    return b"".join([msg.serialize_to_bytes() for msg in msgs])
 
 
 def deserialize_message(data):
     """
-    Deserialize bytes into derivative of GenericMessage
+    Deserialize bytes into derivative of GenericMessage. Messages without fields (_EmptyBodyMessage derivatives) are
+    shared instances: every frame with their opcode returns the same object, so results compare with "is" and cannot
+    tell frames apart by identity, e.g. in id() keyed bookkeeping. Callers keeping per-message objects should wrap the
+    message or create their own instance with type(msg)()
 
-    :param data:    Data to be deserialized
+    :param data:    bytes-like object, data to be deserialized. Non-bytes input, e.g. memoryview slice of receive
+                    buffer, is copied once, so message fields never alias caller memory
     :return:        GenericMessage or derivative, deserialized message
     """
-    try:
-        cmd = data[1]
-    except IndexError:
+    if len(data) < UART_LENGTH_LEN + UART_CMD_LEN:
         raise InvalidLen
 
-    stream = io.BytesIO(data)
+    opcode = data[UART_LENGTH_LEN]
+    msg_class = UART_DISPATCH[opcode]
+    if msg_class is None:
+        raise InvalidOpcode
 
-    try:
-        msg_class = UART_CLASSES[cmd]
+    msg = _STATELESS_MESSAGES[opcode]
+    if msg is None:
         msg = msg_class()
-        msg.deserialize(stream)
-        return msg
-    except KeyError:
-        raise InvalidOpcode
+    msg.deserialize_from_buffer(data if type(data) is bytes else bytes(data))
+    return msg
+
+
+def read_message(stream):
+    """
+    Read single message from stream and deserialize it into derivative of GenericMessage. Header is read first to
+    learn frame length, so exactly one frame is consumed and the stream stays aligned to frame boundary even if
+    opcode is not supported. Messages without fields are shared instances, returned for every frame with their opcode,
+    as in deserialize_message.
+
+    :param stream:  stream providing read(size), e.g. io.BytesIO or serial port
+    :return:        GenericMessage or derivative, deserialized message
+    """
+    header = stream.read(UART_LENGTH_LEN + UART_CMD_LEN)
+    if len(header) != UART_LENGTH_LEN + UART_CMD_LEN:
+        raise InvalidLen
+
+    return deserialize_message(header + stream.read(header[0]))
+
+
+def deserialize_stream(data):
+    """
+    Deserialize bytes containing back-to-back messages into derivatives of GenericMessage.
+    Messages are deserialized directly from the buffer at their offsets, so no per-message stream is created.
+    Messages without fields are shared instances, returned for every frame with their opcode, as in
+    deserialize_message.
+
+    :param data:    Data to be deserialized, concatenated serialized messages
+    :return:        generator of GenericMessage or derivative, deserialized messages
+    """
+    data = data if type(data) is bytes else bytes(data)
+    data_len = len(data)
+    offset = 0
+
+    while offset < data_len:
+        if data_len - offset < UART_LENGTH_LEN + UART_CMD_LEN:
+            raise InvalidLen
+
+        opcode = data[offset + UART_LENGTH_LEN]
+        msg_class = UART_DISPATCH[opcode]
+        if msg_class is None:
+            raise InvalidOpcode
+
+        msg = _STATELESS_MESSAGES[opcode]
+        if msg is None:
+            msg = msg_class()
+        offset = msg.deserialize_from_buffer(data, offset)
+        yield msg
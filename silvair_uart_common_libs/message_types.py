@@ -1,10 +1,19 @@
+import struct
 from enum import IntEnum
 
 
+class InvalidLen(Exception):
+    """
+    Invalid len exception
+    """
+    pass
+
+
 class Serializable:
     """
     Abstract class describing serializable class
     """
+    __slots__ = ()
 
     def serialize(self, stream):
         """
@@ -28,6 +37,13 @@ class Serializable:
 UART_MODEL_ID_LEN = 2
 UART_SENSOR_SETUP_SERVER_CONFIG_LEN = 10
 
+_EMPTY = bytes()
+
+_MODEL_ID_STRUCT = struct.Struct('<H')
+_pack_model_id = _MODEL_ID_STRUCT.pack
+_unpack_model_id = _MODEL_ID_STRUCT.unpack
+_unpack_model_id_from = _MODEL_ID_STRUCT.unpack_from
+
 
 class ModelID(IntEnum):
     """
@@ -49,6 +65,24 @@ class ModelID(IntEnum):
     LightCTLServerID = 0x1303
 
 
+_SENSOR_SETUP_SERVER_ID = int(ModelID.SensorSetupServerID)
+
+_MODEL_ID_LUT = {int(model_id): model_id for model_id in ModelID}
+
+
+def model_id_from_value(value):
+    """
+    Get ModelID member for given opcode value. Uses lookup table instead of ModelID(value) enum construction
+
+    :param value:   int, Mesh Model ID opcode
+    :return:        ModelID, model id. ValueError is raised if model id is not supported
+    """
+    model_id = _MODEL_ID_LUT.get(value)
+    if model_id is None:
+        model_id = ModelID(value)
+    return model_id
+
+
 class FactoryResetSource(IntEnum):
     """
     Enumerator mapping Factory Reset source to its name.
@@ -116,6 +150,26 @@ class DfuStatus(IntEnum):
     NotInProgress = 0x00
 
 
+# Raw values mapped to enum members, source of enum_byte_lut tables, so decoding does not go through enum construction
+_ENUM_LUTS = {
+    enum_cls: {int(member): member for member in enum_cls}
+    for enum_cls in (FactoryResetSource, ModemState, Error, DFUStatus, AttentionEvent, DfuStatus)
+}
+
+_BYTE_VALUES = 256
+
+
+def enum_byte_lut(enum_cls):
+    """
+    Get table of enum members indexed by raw single byte value, for decoding with a plain tuple index
+
+    :param enum_cls:    IntEnum derivative, one of enums defined in this module
+    :return:            tuple of _BYTE_VALUES enum_cls members, None for values which are not valid
+    """
+    members = _ENUM_LUTS[enum_cls]
+    return tuple(members.get(value) for value in range(_BYTE_VALUES))
+
+
 class ModelDesc(Serializable):
     """
     Class representing Mesh Model Description
@@ -123,32 +177,95 @@ class ModelDesc(Serializable):
         self.model_id - Mesh Model ID opcode
         self.config   - optional model configuration
     """
+    __slots__ = ('_model_id', '_is_sensor_setup', '_config', '_encoded')
 
     def __init__(self, model_id: ModelID = None):
         """
         Initialize class and all its fields
         """
-        super().__init__()
+        self._config = _EMPTY
         self.model_id = model_id
-        self.config = bytes()
+
+    @property
+    def model_id(self):
+        """
+        Mesh Model ID opcode
+        """
+        return self._model_id
+
+    @model_id.setter
+    def model_id(self, model_id):
+        """
+        Set Mesh Model ID opcode and refresh serialized form
+
+        :param model_id:  ModelID or int, Mesh Model ID opcode
+        """
+        self._model_id = model_id
+        self._is_sensor_setup = model_id == _SENSOR_SETUP_SERVER_ID
+        self._update_encoded()
+
+    @property
+    def config(self):
+        """
+        Model configuration, serialized only for Sensor Setup Server model
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        """
+        Set model configuration and refresh serialized form
+
+        :param config:  bytes, model configuration
+        """
+        self._config = config
+        self._update_encoded()
+
+    def _update_encoded(self):
+        """
+        Materialize serialized model description, so serialize is a single write
+
+        :return:    None
+        """
+        if self._model_id is None:
+            self._encoded = None
+        elif self._is_sensor_setup:
+            self._encoded = _pack_model_id(self._model_id) + self._config
+        else:
+            self._encoded = _pack_model_id(self._model_id)
 
     def __eq__(self, other):
         """
-        Compare two models. Returns true if all fields are identical.
+        Compare two models. Returns true if all fields are identical. Configuration is compared only for
+        Sensor Setup Server model, as it is not serialized for other models.
 
         :param other:     ModelDesc, other model to be compared with self
-        :return:          True if identical, False otherwise
+        :return:          True if identical, False otherwise. NotImplemented if other is not ModelDesc
         """
-        return self.model_id == other.model_id and self.config == other.config
+        if self is other:
+            return True
+
+        if not isinstance(other, ModelDesc):
+            return NotImplemented
+
+        if self._model_id != other.model_id:
+            return False
+
+        if self._is_sensor_setup:
+            return self._config == other.config
+
+        return True
 
     def get_length(self):
         """
-        Get serialized model id len. This should be used ONLY when all fields are filled
+        Get serialized model id len. This should be used ONLY when all fields are filled. Configuration length is
+        added only for Sensor Setup Server model, as configuration is not serialized for other models
 
-        :param config:  If True configuration length is added
         :return:        int, serialized model id length
         """
-        return UART_MODEL_ID_LEN + len(self.config)
+        if self._is_sensor_setup:
+            return UART_MODEL_ID_LEN + len(self._config)
+        return UART_MODEL_ID_LEN
 
     def serialize(self, stream):
         """
@@ -158,10 +275,7 @@ class ModelDesc(Serializable):
         :param config:  If True configuration is added
         :return:        None
         """
-        stream.write(self.model_id.to_bytes(UART_MODEL_ID_LEN, byteorder='little', signed=False))
-
-        if self.model_id == ModelID.SensorSetupServerID:
-            stream.write(self.config)
+        stream.write(self._encoded)
 
     def deserialize(self, stream):
         """
@@ -171,8 +285,85 @@ class ModelDesc(Serializable):
         :param config:  If True configuration is expected
         :return:        None
         """
-        b = stream.read(UART_MODEL_ID_LEN)
-        self.model_id = ModelID.from_bytes(b, byteorder='little')
+        model_id_bytes = stream.read(UART_MODEL_ID_LEN)
+        model_id, = _unpack_model_id(model_id_bytes)
+        self._model_id = model_id_from_value(model_id)
+        self._is_sensor_setup = model_id == _SENSOR_SETUP_SERVER_ID
+
+        if self._is_sensor_setup:
+            self._config = stream.read(UART_SENSOR_SETUP_SERVER_CONFIG_LEN)
+            self._encoded = model_id_bytes + self._config
+        else:
+            self._encoded = model_id_bytes
+
+    def serialized(self):
+        """
+        Get serialized model description, same bytes as written by serialize
+
+        :return:    bytes, serialized model description
+        """
+        return self._encoded
+
+    def pack_into(self, buf, offset=0):
+        """
+        Serialize model description into preallocated buffer. Counterpart of serialize working on buffer instead of
+        stream
+
+        :param buf:     bytearray, destination buffer, large enough to hold serialized model description
+        :param offset:  int, position in buffer where model description is placed
+        :return:        int, position of the first byte following model description
+        """
+        end = offset + len(self._encoded)
+        buf[offset:end] = self._encoded
+        return end
+
+    @classmethod
+    def unpack_from(cls, buf, offset=0):
+        """
+        Create model description from buffer. Counterpart of deserialize working on buffer instead of stream,
+        model description is created without running __init__
+
+        :param buf:     bytes, source buffer
+        :param offset:  int, position of serialized model description in buffer
+        :return:        tuple: ModelDesc, position of the first byte following model description
+        """
+        model_id, = _unpack_model_id_from(buf, offset)
+        model_desc = cls.__new__(cls)
+        model_desc._model_id = model_id_from_value(model_id)
+        model_desc._is_sensor_setup = model_id == _SENSOR_SETUP_SERVER_ID
+        start = offset
+        offset += UART_MODEL_ID_LEN
+
+        if model_desc._is_sensor_setup:
+            model_desc._config = buf[offset:offset + UART_SENSOR_SETUP_SERVER_CONFIG_LEN]
+            offset += UART_SENSOR_SETUP_SERVER_CONFIG_LEN
+        else:
+            model_desc._config = _EMPTY
+
+        model_desc._encoded = buf[start:offset]
+        return model_desc, offset
+
+    @classmethod
+    def unpack_many(cls, buf, offset, end):
+        """
+        Create model descriptions from buffer with repeated unpack_from, until end of their area is reached
+
+        :param buf:     bytes, source buffer
+        :param offset:  int, position of the first serialized model description in buffer
+        :param end:     int, position of the first byte following area of model descriptions
+        :return:        tuple: list of ModelDesc, position of the first byte following last model description.
+                        InvalidLen is raised if last model description does not end exactly at end
+        """
+        model_descs = []
+
+        while offset < end:
+            if end - offset < UART_MODEL_ID_LEN:
+                raise InvalidLen
+
+            model_desc, offset = cls.unpack_from(buf, offset)
+            if offset > end:
+                raise InvalidLen
+
+            model_descs.append(model_desc)
 
-        if self.model_id == ModelID.SensorSetupServerID:
-            self.config = stream.read(UART_SENSOR_SETUP_SERVER_CONFIG_LEN)
+        return model_descs, offset
@@ -1,7 +1,13 @@
+import array
+import io
+import struct
+import sys
+import zlib
+from abc import ABC, abstractmethod
 from enum import IntEnum
 
 from .message_types import Serializable, ModelDesc, UART_MODEL_ID_LEN, Error, FactoryResetSource, ModemState, \
-    AttentionEvent, DFUStatus, DfuStatus, ModelID
+    AttentionEvent, DFUStatus, DfuStatus, ModelID, model_id_from_value, enum_byte_lut, InvalidLen
 
 UART_CMD_LEN = 1
 UART_LENGTH_LEN = 1
@@ -28,6 +34,49 @@ UART_DFU_PRE_VALIDATION_STATUS_LEN = 1
 UART_COMPANY_ID_LEN = 2
 UART_TEST_ID_LEN = 1
 
+_HEADER = struct.Struct('<BB')
+
+# Common header followed by fixed size fields of messages, so whole fixed part is packed and unpacked with single call
+_HEADER_U8 = struct.Struct('<BBB')
+_HEADER_U32 = struct.Struct('<BBI')
+_MESH_MESSAGE_HEADER = struct.Struct('<BBBBH')
+_MESH_MESSAGE_RESPONSE_HEADER = struct.Struct('<BBBB')
+_SENSOR_UPDATE_HEADER = struct.Struct('<BBBH')
+_DFU_INIT_HEADER = struct.Struct('<BBI32sB')
+_DEVICE_UUID_HEADER = struct.Struct('<BB16s')
+_DFU_STATUS_RESPONSE_HEADER = struct.Struct('<BBBIII')
+_START_TEST_HEADER = struct.Struct('<BBHBB')
+
+# Length of fixed size fields following common header in layouts above, so serializers do not recompute it
+_MESH_MESSAGE_FIXED_LEN = _MESH_MESSAGE_HEADER.size - _HEADER.size
+_MESH_MESSAGE_RESPONSE_FIXED_LEN = _MESH_MESSAGE_RESPONSE_HEADER.size - _HEADER.size
+_SENSOR_UPDATE_FIXED_LEN = _SENSOR_UPDATE_HEADER.size - _HEADER.size
+_DFU_INIT_FIXED_LEN = _DFU_INIT_HEADER.size - _HEADER.size
+_DFU_STATUS_RESPONSE_FIXED_LEN = _DFU_STATUS_RESPONSE_HEADER.size - _HEADER.size
+_START_TEST_FIXED_LEN = _START_TEST_HEADER.size - _HEADER.size
+
+# Fixed size fields of fixed layout messages with common header skipped, for bulk unpacking of back-to-back frames
+_U8_RECORD = struct.Struct('<xxB')
+_DEVICE_UUID_RECORD = struct.Struct('<xx16s')
+_DFU_STATUS_RESPONSE_RECORD = struct.Struct('<xxBIII')
+
+# Zero filled initial values of fixed size bytes fields, immutable, so safely shared by all instances
+_EMPTY_UUID = bytes(UART_UUID_LEN)
+_EMPTY_SHA256 = bytes(UART_DFU_FIRMWARE_SHA256_LEN)
+
+# Enum members indexed by raw field value, None for invalid values, which then raise ValueError in enum construction
+_MODEM_STATES = enum_byte_lut(ModemState)
+_ERRORS = enum_byte_lut(Error)
+_ATTENTION_EVENTS = enum_byte_lut(AttentionEvent)
+_DFU_STATUSES = enum_byte_lut(DFUStatus)
+_DFU_PRE_VALIDATION_STATUSES = enum_byte_lut(DfuStatus)
+
+# Model id list layouts indexed by number of model ids, covering every list fitting in a single message
+_MODEL_ID_LISTS = tuple(struct.Struct('<{}H'.format(count)) for count in range(256 // UART_MODEL_ID_LEN))
+
+# array.array('H') memory matches serialized model id list on little endian platforms with 2 byte unsigned short
+_MODEL_ID_ARRAY_IS_WIRE_FORMAT = sys.byteorder == 'little' and array.array('H').itemsize == UART_MODEL_ID_LEN
+
 
 class UartCommand(IntEnum):
     """
@@ -77,6 +126,10 @@ class UartCommand(IntEnum):
     Generic = 0xFF
 
 
+# UART command names keyed by opcode, valid for both UartCommand members and raw int opcodes
+_UART_COMMAND_NAMES = {int(command): command.name for command in UartCommand}
+
+
 class InvalidOpcode(Exception):
     """
     Invalid opcode exception
@@ -84,39 +137,95 @@ class InvalidOpcode(Exception):
     pass
 
 
-class InvalidLen(Exception):
+def _pack_model_ids(model_ids):
     """
-    Invalid len exception
+    Pack list of model ids with single struct call
+
+    :param model_ids:   list of ModelID or int, or array.array('H'), model ids to be packed. Array memory is copied
+                        as is when it matches serialized layout
+    :return:            bytes, packed model ids
     """
-    pass
+    if type(model_ids) is array.array and model_ids.typecode == 'H' and _MODEL_ID_ARRAY_IS_WIRE_FORMAT:
+        return model_ids.tobytes()
+
+    count = len(model_ids)
+    if count < len(_MODEL_ID_LISTS):
+        return _MODEL_ID_LISTS[count].pack(*model_ids)
+    return struct.pack('<{}H'.format(count), *model_ids)
 
 
-class GenericMessage(Serializable):
+def _unpack_model_ids(data, offset, length):
     """
-    Class representing Generic uart message.
-    Class fields are adequate to message parameters, described in UART specification.
+    Unpack list of model ids from buffer with single struct call
+
+    :param data:    bytes, source buffer
+    :param offset:  int, position of serialized model ids in buffer
+    :param length:  int, length of serialized model ids
+    :return:        list of ModelID, model ids. InvalidLen is raised if length does not match whole model ids
     """
+    if len(data) < offset + length or length % UART_MODEL_ID_LEN != 0:
+        raise InvalidLen
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        self.type = UartCommand.Generic
+    model_ids = _MODEL_ID_LISTS[length // UART_MODEL_ID_LEN].unpack_from(data, offset)
+    return [model_id_from_value(model_id) for model_id in model_ids]
+
+
+def _format_model_ids(model_ids):
+    """
+    Generate string representing list of model ids, joined in single allocation
+
+    :param model_ids:   list of ModelID or int, or array.array('H'), model ids. Names are looked up lazily, only here
+    :return:            str, model ids with their names
+    """
+    return "".join(["0x{:04x} {:s}, ".format(model_id, model_id_from_value(model_id).name) for model_id in model_ids])
+
+
+class GenericMessage(Serializable, ABC):
+    """
+    Class representing Generic uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    Message type is a class attribute, constant for each derivative. GenericMessage itself is abstract and cannot be
+    instantiated, derivatives overload serialize and deserialize. Buffer methods serialize_to_bytes and
+    deserialize_from_buffer go through them by default.
+    Messages of this package derive from _BufferMessage, which reverses it, so messages are packed and unpacked
+    directly on buffers. Derivatives without any fields derive from _EmptyBodyMessage, which sets _STATELESS, so a
+    single deserialized instance can be shared.
+    """
+    __slots__ = ()
+    _STATELESS = False
+    _RECORD = None
+    type = UartCommand.Generic
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return self.type.name
+        return _UART_COMMAND_NAMES[self.type]
 
     def __eq__(self, other):
         """
-        Compare two messages. Returns true if all fields are identical.
+        Compare two messages. Returns true if all fields are identical. Identity and message class are checked here,
+        fields are compared by _fields_equal of derivative
 
         :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
+        :return:          True if identical, False otherwise. NotImplemented if other is not the same message class
+        """
+        if self is other:
+            return True
+
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self._fields_equal(other)
+
+    def _fields_equal(self, other):
+        """
+        Compare fields of two messages of the same class. Overload this in derivative class with fields
+
+        :param other:     GenericMessage or derivative, other message of the same class as self
+        :return:          True if all fields are identical, False otherwise
         """
-        return self.type == other.type
+        return True
 
     def get_length(self):
         """
@@ -133,10 +242,7 @@ class GenericMessage(Serializable):
         :param stream:  io.BytesIO stream, destination
         :return:        None
         """
-        length = self.get_length()
-
-        stream.write(length.to_bytes(UART_LENGTH_LEN, byteorder='little', signed=False))
-        stream.write(self.type.to_bytes(UART_CMD_LEN, byteorder='little', signed=False))
+        stream.write(_HEADER.pack(self.get_length(), self.type))
 
     def deserialize_common_part(self, stream):
         """
@@ -145,130 +251,121 @@ class GenericMessage(Serializable):
         :param stream:  io.BytesIO stream, source stream to read from
         :return:        int, message length
         """
-        length = int.from_bytes(stream.read(UART_LENGTH_LEN), byteorder='little')
-        opcode = int.from_bytes(stream.read(UART_CMD_LEN), byteorder='little')
-
-        if opcode != self.type:
-            raise InvalidOpcode
-
+        length, _ = self.unpack_fixed_part(stream.read(_HEADER.size), 0, _HEADER)
         return length
 
-    def serialize(self, stream):
-        """
-        Serialize message into bytes. Overload this in derivative class
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        assert False, "Not implemented method cannot be used"
-
-    def deserialize(self, stream):
+    def unpack_fixed_part(self, data, offset, fields):
         """
-        Deserialize message, fill fields consuming stream. Overload this in derivative class
+        Unpack common message part together with fixed size fields following it from buffer. Buffer size is checked by
+        unpack_from itself and opcode is checked on unpacked fields, so valid frames pay for no separate len() call
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :param fields:  struct.Struct, layout of common message part and fixed size fields
+        :return:        tuple, message length, opcode and unpacked fields
         """
-        assert False, "Not implemented method cannot be used"
+        try:
+            unpacked = fields.unpack_from(data, offset)
+        except struct.error:
+            # Opcode of short frame is still checked, so InvalidOpcode keeps precedence over InvalidLen
+            if len(data) > offset + UART_LENGTH_LEN and data[offset + UART_LENGTH_LEN] != self.type:
+                raise InvalidOpcode from None
+            raise InvalidLen from None
 
+        if unpacked[1] != self.type:
+            raise InvalidOpcode
 
-class PingRequestMessage(GenericMessage):
-    """
-    Class representing PingRequest uart message.
-    Class fields are adequate to message parameters, described in UART specification.
-    """
+        return unpacked
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
+    @classmethod
+    def unpack_records(cls, data):
         """
-        super().__init__()
-        self.type = UartCommand.PingRequest
-        self.data = bytes()
+        Unpack back-to-back frames of fixed layout message into raw field tuples, without creating message objects.
+        Fields are in wire order and enums are left as raw ints, so this suits bulk analysis of captured UART traffic
 
-    def __eq__(self, other):
+        :param data:    bytes-like object, concatenated serialized messages of this class only
+        :return:        list of tuples, fixed size fields of each message
         """
-        Compare two messages. Returns true if all fields are identical.
+        record = cls._RECORD
+        if record is None:
+            raise TypeError(f"{cls.__name__} has no fixed layout")
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.data == other.data
+        count, rest = divmod(len(data), record.size)
+        data = bytes(data)
+        end = count * record.size
 
-    def __str__(self):
-        """
-        Generate string representing message
-        """
-        return super().__str__() + ", data= " + self.data.hex()
+        if data[UART_LENGTH_LEN:end:record.size] != bytes((cls.type,)) * count:
+            raise InvalidOpcode
 
-    def get_length(self):
-        """
-        Get serialized message len. This should be used ONLY when all fields are filled
+        if rest or data[:end:record.size] != bytes((record.size - _HEADER.size,)) * count:
+            raise InvalidLen
 
-        :return:    int, serialized message length
-        """
-        return len(self.data)
+        return list(record.iter_unpack(data))
 
+    @abstractmethod
     def serialize(self, stream):
         """
-        Serialize message into bytes
+        Serialize message into bytes. Overload this in derivative class
 
         :param stream:  io.BytesIO stream, destination
         :return:        None
         """
-        self.serialize_common_part(stream)
-        stream.write(self.data)
+        pass
 
+    @abstractmethod
     def deserialize(self, stream):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message, fill fields consuming stream. Overload this in derivative class
 
         :param stream:  io.BytesIO stream, source stream to read from
         :return:        None
         """
-        length = self.deserialize_common_part(stream)
-        self.data = stream.read(length)
-
-        if length != len(self.data):
-            raise InvalidLen
-
-
-class PongResponseMessage(GenericMessage):
-    """
-    Class representing PongResponse uart message.
-    Class fields are adequate to message parameters, described in UART specification.
-    """
+        pass
 
-    def __init__(self):
+    def serialize_to_bytes(self):
         """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.PongResponse
-        self.data = bytes()
+        Serialize message into bytes, written by serialize into intermediate stream
 
-    def __eq__(self, other):
+        :return:    bytes, serialized message
         """
-        Compare two messages. Returns true if all fields are identical.
+        stream = io.BytesIO()
+        self.serialize(stream)
+        return stream.getvalue()
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
+    @classmethod
+    def from_bytes(cls, data):
         """
-        return super().__eq__(other) and self.data == other.data
+        Create message from single serialized frame held in memory, with deserialize_from_buffer
 
-    def __str__(self):
-        """
-        Generate string representing message
+        :param data:    bytes-like object, serialized message. Non-bytes input, e.g. memoryview slice of receive
+                        buffer, is copied once, so message fields never alias caller memory
+        :return:        GenericMessage derivative, deserialized message. InvalidOpcode is raised if frame is of
+                        another message class
         """
-        return super().__str__() + ", data= " + self.data.hex()
+        msg = cls()
+        msg.deserialize_from_buffer(data if type(data) is bytes else bytes(data))
+        return msg
 
-    def get_length(self):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Get serialized message len. This should be used ONLY when all fields are filled
+        Deserialize message from buffer, consumed by deserialize from intermediate stream
 
-        :return:    int, serialized message length
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        return len(self.data)
+        stream = io.BytesIO(data)
+        stream.seek(offset)
+        self.deserialize(stream)
+        return stream.tell()
+
+
+class _BufferMessage(GenericMessage):
+    """
+    Base class of uart messages of this package, packed and unpacked directly on buffers.
+    Stream methods go through buffer methods, which derivatives overload.
+    """
+    __slots__ = ()
 
     def serialize(self, stream):
         """
@@ -277,55 +374,66 @@ class PongResponseMessage(GenericMessage):
         :param stream:  io.BytesIO stream, destination
         :return:        None
         """
-        self.serialize_common_part(stream)
-        stream.write(self.data)
+        stream.write(self.serialize_to_bytes())
+
+    @abstractmethod
+    def serialize_to_bytes(self):
+        """
+        Serialize message into bytes, without intermediate stream. Overload this in derivative class
+
+        :return:    bytes, serialized message
+        """
+        pass
 
     def deserialize(self, stream):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message, fill fields consuming stream. Single frame, as long as its header says, is read
 
         :param stream:  io.BytesIO stream, source stream to read from
         :return:        None
         """
-        length = self.deserialize_common_part(stream)
-        self.data = stream.read(length)
+        data = stream.read(UART_LENGTH_LEN + UART_CMD_LEN)
 
-        if length != len(self.data):
-            raise InvalidLen
+        if len(data) == UART_LENGTH_LEN + UART_CMD_LEN:
+            data += stream.read(data[0])
+
+        self.deserialize_from_buffer(data)
+
+    @abstractmethod
+    def deserialize_from_buffer(self, data, offset=0):
+        """
+        Deserialize message from buffer, fill fields without intermediate stream. Overload this in derivative class
+
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
+        """
+        pass
 
 
-class InitDeviceEventMessage(GenericMessage):
+class PingRequestMessage(_BufferMessage):
     """
-    Class representing InitDeviceEvent uart message.
+    Class representing PingRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('data',)
+    type = UartCommand.PingRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.InitDeviceEvent
-        self.model_ids = list()
+        self.data = b""
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.model_ids == other.model_ids
+    def _fields_equal(self, other):
+        return self.data == other.data
 
     def __str__(self):
         """
         Generate string representing message
         """
-        output = super().__str__() + ", model_ids= "
-        for model_id in self.model_ids:
-            output += "0x{:04x} {:s}, ".format(model_id, model_id.name)
-
-        return output
+        return super().__str__() + ", data= " + self.data.hex()
 
     def get_length(self):
         """
@@ -333,69 +441,57 @@ class InitDeviceEventMessage(GenericMessage):
 
         :return:    int, serialized message length
         """
-        length = UART_MODEL_ID_LEN * len(self.model_ids)
-        return length
+        return len(self.data)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        for model_id in self.model_ids:
-            stream.write(model_id.to_bytes(UART_MODEL_ID_LEN, byteorder='little', signed=False))
+        return _HEADER.pack(len(self.data), self.type) + self.data
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        while length >= UART_MODEL_ID_LEN:
-            model_id = ModelID.from_bytes(stream.read(UART_MODEL_ID_LEN), byteorder='little')
-            length -= UART_MODEL_ID_LEN
-            self.model_ids.append(model_id)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
+        start = offset + _HEADER.size
+        self.data = data[start:start + length]
 
-        if length != 0:
+        if length != len(self.data):
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class CreateInstancesRequestMessage(GenericMessage):
+class PongResponseMessage(_BufferMessage):
     """
-    Class representing CreateInstancesRequest uart message.
+    Class representing PongResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('data',)
+    type = UartCommand.PongResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.CreateInstancesRequest
-        self.model_descs = list()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.data = b""
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.model_descs == other.model_descs
+    def _fields_equal(self, other):
+        return self.data == other.data
 
     def __str__(self):
         """
         Generate string representing message
         """
-        output = super().__str__() + ", model_ids= "
-        for model_desc in self.model_descs:
-            output += "0x{:04x} {:s}, ".format(model_desc.model_id, model_desc.model_id.name)
-
-        return output
+        return super().__str__() + ", data= " + self.data.hex()
 
     def get_length(self):
         """
@@ -403,72 +499,56 @@ class CreateInstancesRequestMessage(GenericMessage):
 
         :return:    int, serialized message length
         """
-        length = 0
-        for model_desc in self.model_descs:
-            length += model_desc.get_length()
-        return length
+        return len(self.data)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        for model_desc in self.model_descs:
-            model_desc.serialize(stream)
+        return _HEADER.pack(len(self.data), self.type) + self.data
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        while length >= UART_MODEL_ID_LEN:
-            model_desc = ModelDesc()
-            model_desc.deserialize(stream)
-            length -= model_desc.get_length()
-            self.model_descs.append(model_desc)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
+        start = offset + _HEADER.size
+        self.data = data[start:start + length]
 
-        if length != 0:
+        if length != len(self.data):
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class CreateInstancesResponseMessage(GenericMessage):
+
+class _ModelIdListMessage(_BufferMessage):
     """
-    Class representing CreateInstancesResponse uart message.
-    Class fields are adequate to message parameters, described in UART specification.
+    Base class of uart messages carrying only a list of model ids.
+    Derivatives set message type, serialization is shared.
     """
+    __slots__ = ('model_ids',)
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.CreateInstancesResponse
         self.model_ids = list()
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.model_ids == other.model_ids
+    def _fields_equal(self, other):
+        return self.model_ids == other.model_ids
 
     def __str__(self):
         """
         Generate string representing message
         """
-        output = super().__str__() + ", model_ids= "
-        for model_id in self.model_ids:
-            output += "0x{:04x} {:s}, ".format(model_id, model_id.name)
-
-        return output
+        return super().__str__() + ", model_ids= " + _format_model_ids(self.model_ids)
 
     def get_length(self):
         """
@@ -479,66 +559,62 @@ class CreateInstancesResponseMessage(GenericMessage):
         length = UART_MODEL_ID_LEN * len(self.model_ids)
         return length
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        for model_id in self.model_ids:
-            stream.write(model_id.to_bytes(UART_MODEL_ID_LEN, byteorder='little', signed=False))
+        payload = _pack_model_ids(self.model_ids)
+        return _HEADER.pack(len(payload), self.type) + payload
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        while length >= UART_MODEL_ID_LEN:
-            model_id = ModelID.from_bytes(stream.read(UART_MODEL_ID_LEN), byteorder='little')
-            length -= UART_MODEL_ID_LEN
-            self.model_ids.append(model_id)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
+        self.model_ids.extend(_unpack_model_ids(data, offset + _HEADER.size, length))
 
-        if length != 0:
-            raise InvalidLen
+        return offset + _HEADER.size + data[offset]
 
 
-class InitNodeEventMessage(GenericMessage):
+class InitDeviceEventMessage(_ModelIdListMessage):
     """
-    Class representing InitNodeEvent uart message.
+    Class representing InitDeviceEvent uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    """
+    __slots__ = ()
+    type = UartCommand.InitDeviceEvent
+
+
+class CreateInstancesRequestMessage(_BufferMessage):
+    """
+    Class representing CreateInstancesRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('model_descs',)
+    type = UartCommand.CreateInstancesRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.InitNodeEvent
-        self.model_ids = list()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.model_descs = list()
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.model_ids == other.model_ids
+    def _fields_equal(self, other):
+        return self.model_descs == other.model_descs
 
     def __str__(self):
         """
         Generate string representing message
         """
-        output = super().__str__() + ", model_ids= "
-        for model_id in self.model_ids:
-            output += "0x{:04x} {:s}, ".format(model_id, model_id.name)
-
-        return output
+        return super().__str__() + ", model_ids= " + \
+               _format_model_ids([model_desc.model_id for model_desc in self.model_descs])
 
     def get_length(self):
         """
@@ -546,75 +622,87 @@ class InitNodeEventMessage(GenericMessage):
 
         :return:    int, serialized message length
         """
-        length = UART_MODEL_ID_LEN * len(self.model_ids)
+        length = 0
+        for model_desc in self.model_descs:
+            length += model_desc.get_length()
         return length
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        for model_id in self.model_ids:
-            stream.write(model_id.to_bytes(UART_MODEL_ID_LEN, byteorder='little', signed=False))
+        payload = b"".join([model_desc.serialized() for model_desc in self.model_descs])
+        return _HEADER.pack(len(payload), self.type) + payload
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        while length >= UART_MODEL_ID_LEN:
-            model_id = ModelID.from_bytes(stream.read(UART_MODEL_ID_LEN), byteorder='little')
-            length -= UART_MODEL_ID_LEN
-            self.model_ids.append(model_id)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
+        position = offset + _HEADER.size
+        end = position + length
 
-        if length != 0:
+        if len(data) < end:
             raise InvalidLen
 
+        model_descs, _ = ModelDesc.unpack_many(data, position, end)
+        self.model_descs.extend(model_descs)
 
-class MeshMessageRequestMessage(GenericMessage):
+        return end
+
+
+class CreateInstancesResponseMessage(_ModelIdListMessage):
+    """
+    Class representing CreateInstancesResponse uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    """
+    __slots__ = ()
+    type = UartCommand.CreateInstancesResponse
+
+
+class InitNodeEventMessage(_ModelIdListMessage):
+    """
+    Class representing InitNodeEvent uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    """
+    __slots__ = ()
+    type = UartCommand.InitNodeEvent
+
+
+class MeshMessageRequestMessage(_BufferMessage):
     """
     Class representing MeshMessageRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('instance_index', 'sub_index', 'mesh_opcode', 'mesh_command')
+    type = UartCommand.MeshMessageRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.MeshMessageRequest
         self.instance_index = 0
         self.sub_index = 0
         self.mesh_opcode = 0
-        self.mesh_command = bytes()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.mesh_command = b""
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.instance_index == other.instance_index and \
-               self.sub_index == other.sub_index and \
-               self.mesh_opcode == other.mesh_opcode and \
-               self.mesh_command == other.mesh_command
+    def _fields_equal(self, other):
+        return (self.instance_index, self.sub_index, self.mesh_opcode, self.mesh_command) == \
+               (other.instance_index, other.sub_index, other.mesh_opcode, other.mesh_command)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", instance_index=" + str(self.instance_index) \
-               + ", sub_index=" + str(self.sub_index) \
-               + ", mesh_opcode=" + str(self.mesh_opcode) \
-               + ", mesh_command=" + self.mesh_command.hex()
+        return f"{super().__str__()}, instance_index={self.instance_index}, sub_index={self.sub_index}" \
+               f", mesh_opcode={self.mesh_opcode}, mesh_command={self.mesh_command.hex()}"
 
     def get_length(self):
         """
@@ -627,246 +715,147 @@ class MeshMessageRequestMessage(GenericMessage):
                UART_MESH_OPCODE_LEN + \
                len(self.mesh_command)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.instance_index.to_bytes(UART_INSTANCE_INDEX_LEN, byteorder='little', signed=False))
-        stream.write(self.sub_index.to_bytes(UART_SUB_INDEX_LEN, byteorder='little', signed=False))
-        stream.write(self.mesh_opcode.to_bytes(UART_MESH_OPCODE_LEN, byteorder='little', signed=False))
-        stream.write(self.mesh_command)
+        return _MESH_MESSAGE_HEADER.pack(_MESH_MESSAGE_FIXED_LEN + len(self.mesh_command), self.type,
+                                         self.instance_index, self.sub_index, self.mesh_opcode) + self.mesh_command
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.instance_index = int.from_bytes(stream.read(UART_INSTANCE_INDEX_LEN), byteorder='little')
-        self.sub_index = int.from_bytes(stream.read(UART_SUB_INDEX_LEN), byteorder='little')
-        self.mesh_opcode = int.from_bytes(stream.read(UART_MESH_OPCODE_LEN), byteorder='little')
+        length, _, self.instance_index, self.sub_index, self.mesh_opcode = \
+            self.unpack_fixed_part(data, offset, _MESH_MESSAGE_HEADER)
 
         length -= UART_INSTANCE_INDEX_LEN + UART_SUB_INDEX_LEN + UART_MESH_OPCODE_LEN
 
-        self.mesh_command = stream.read(length)
+        start = offset + _MESH_MESSAGE_HEADER.size
+        self.mesh_command = data[start:start + length]
 
         if length != len(self.mesh_command):
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class StartNodeRequestMessage(GenericMessage):
+
+class _EmptyBodyMessage(_BufferMessage):
     """
-    Class representing StartNodeRequest uart message.
-    Class fields are adequate to message parameters, described in UART specification.
+    Base class of uart messages without any fields.
+    Derivatives set message type, serialization is shared and a single deserialized instance can be shared.
     """
+    __slots__ = ()
+    _STATELESS = True
+    _ENCODED = b""
 
-    def __init__(self):
+    def __init_subclass__(cls, **kwargs):
         """
-        Initialize message and all its fields
+        Precompute serialized form of derivative, which is constant as message has no fields
         """
-        super().__init__()
-        self.type = UartCommand.StartNodeRequest
+        super().__init_subclass__(**kwargs)
+        cls._ENCODED = _HEADER.pack(0, cls.type)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
+        return self._ENCODED
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
 
         if length != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class StartNodeResponseMessage(GenericMessage):
+class StartNodeRequestMessage(_EmptyBodyMessage):
     """
-    Class representing StartNodeResponse uart message.
+    Class representing StartNodeRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.StartNodeRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.StartNodeResponse
 
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
+class StartNodeResponseMessage(_EmptyBodyMessage):
+    """
+    Class representing StartNodeResponse uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    """
+    __slots__ = ()
+    type = UartCommand.StartNodeResponse
 
 
-class FactoryResetRequestMessage(GenericMessage):
+class FactoryResetRequestMessage(_EmptyBodyMessage):
     """
     Class representing FactoryResetRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.FactoryResetRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.FactoryResetRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class FactoryResetResponseMessage(GenericMessage):
+class FactoryResetResponseMessage(_EmptyBodyMessage):
     """
     Class representing FactoryResetResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.FactoryResetResponse
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.FactoryResetResponse
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class FactoryResetEventMessage(GenericMessage):
+class FactoryResetEventMessage(_EmptyBodyMessage):
     """
     Class representing FactoryResetEvent uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
-
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.FactoryResetEvent
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
+    __slots__ = ()
+    type = UartCommand.FactoryResetEvent
 
 
-class MeshMessageResponseMessage(GenericMessage):
+class MeshMessageResponseMessage(_BufferMessage):
     """
     Class representing MeshMessageResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('instance_index', 'sub_index')
+    type = UartCommand.MeshMessageResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.MeshMessageResponse
         self.instance_index = int()
         self.sub_index = int()
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.instance_index == other.instance_index and \
-               self.sub_index == other.sub_index
+    def _fields_equal(self, other):
+        return (self.instance_index, self.sub_index) == \
+               (other.instance_index, other.sub_index)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", instance_index=" + str(self.instance_index) \
-               + ", sub_index=" + str(self.sub_index)
+        return f"{super().__str__()}, instance_index={self.instance_index}, sub_index={self.sub_index}"
 
     def get_length(self):
         """
@@ -876,89 +865,59 @@ class MeshMessageResponseMessage(GenericMessage):
         """
         return UART_INSTANCE_INDEX_LEN + UART_SUB_INDEX_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.instance_index.to_bytes(UART_INSTANCE_INDEX_LEN, byteorder='little', signed=False))
-        stream.write(self.sub_index.to_bytes(UART_SUB_INDEX_LEN, byteorder='little', signed=False))
+        return _MESH_MESSAGE_RESPONSE_HEADER.pack(_MESH_MESSAGE_RESPONSE_FIXED_LEN, self.type, self.instance_index,
+                                                  self.sub_index)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.instance_index = int.from_bytes(stream.read(UART_INSTANCE_INDEX_LEN), byteorder='little')
-        self.sub_index = int.from_bytes(stream.read(UART_SUB_INDEX_LEN), byteorder='little')
+        length, _, self.instance_index, self.sub_index = \
+            self.unpack_fixed_part(data, offset, _MESH_MESSAGE_RESPONSE_HEADER)
 
         if length - UART_INSTANCE_INDEX_LEN - UART_SUB_INDEX_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class CurrentStateRequestMessage(GenericMessage):
+class CurrentStateRequestMessage(_EmptyBodyMessage):
     """
     Class representing CurrentStateRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.CurrentStateRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.CurrentStateRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class CurrentStateResponseMessage(GenericMessage):
+class CurrentStateResponseMessage(_BufferMessage):
     """
     Class representing CurrentStateResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('state',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.CurrentStateResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.CurrentStateResponse
-        self.state = ModemState(ModemState.Unknown)
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.state = ModemState.Unknown
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.state == other.state
+    def _fields_equal(self, other):
+        return self.state == other.state
 
     def __str__(self):
         """
@@ -974,52 +933,52 @@ class CurrentStateResponseMessage(GenericMessage):
         """
         return UART_MODEM_STATE_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.state.to_bytes(UART_MODEM_STATE_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_MODEM_STATE_LEN, self.type, self.state)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.state = ModemState.from_bytes(stream.read(UART_MODEM_STATE_LEN), byteorder='little')
+        length, _, state = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.state = _MODEM_STATES[state]
+
+        if self.state is None:
+            self.state = ModemState(state)
 
         if length - UART_MODEM_STATE_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class ErrorMessage(GenericMessage):
+class ErrorMessage(_BufferMessage):
     """
     Class representing Error uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('error',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.Error
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.Error
-        self.error = Error(Error.InvalidCRC)
+        self.error = Error.InvalidCRC
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.error == other.error
+    def _fields_equal(self, other):
+        return self.error == other.error
 
     def __str__(self):
         """
@@ -1035,87 +994,60 @@ class ErrorMessage(GenericMessage):
         """
         return UART_ERROR_ID_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.error.to_bytes(UART_ERROR_ID_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_ERROR_ID_LEN, self.type, self.error)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.error = Error.from_bytes(stream.read(UART_ERROR_ID_LEN), byteorder='little')
+        length, _, error = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.error = _ERRORS[error]
+
+        if self.error is None:
+            self.error = Error(error)
 
         if length - UART_ERROR_ID_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class FirmwareVersionRequestMessage(GenericMessage):
+
+class FirmwareVersionRequestMessage(_EmptyBodyMessage):
     """
     Class representing FirmwareVersionRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.FirmwareVersionRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.FirmwareVersionRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class FirmwareVersionResponseMessage(GenericMessage):
+class FirmwareVersionResponseMessage(_BufferMessage):
     """
     Class representing FirmwareVersionResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('firmware_version',)
+    type = UartCommand.FirmwareVersionResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.FirmwareVersionResponse
-        self.firmware_version = bytes()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.firmware_version = b""
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.firmware_version == other.firmware_version
+    def _fields_equal(self, other):
+        return self.firmware_version == other.firmware_version
 
     def __str__(self):
         """
@@ -1131,66 +1063,63 @@ class FirmwareVersionResponseMessage(GenericMessage):
         """
         return len(self.firmware_version)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.firmware_version)
+        return _HEADER.pack(len(self.firmware_version), self.type) + self.firmware_version
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
+        length, _ = self.unpack_fixed_part(data, offset, _HEADER)
 
         if length == 0:
             raise InvalidLen
 
-        self.firmware_version = stream.read(length)
+        start = offset + _HEADER.size
+        self.firmware_version = data[start:start + length]
+
+        if length != len(self.firmware_version):
+            raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class SensorUpdateRequestMessage(GenericMessage):
+
+class SensorUpdateRequestMessage(_BufferMessage):
     """
     Class representing SensorUpdateRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('instance_index', 'property_id', 'data')
+    type = UartCommand.SensorUpdateRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.SensorUpdateRequest
         self.instance_index = int()
         self.property_id = int()
-        self.data = bytes()
+        self.data = b""
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.instance_index == other.instance_index and \
-               self.property_id == other.property_id and \
-               self.data == other.data
+    def _fields_equal(self, other):
+        return (self.instance_index, self.property_id, self.data) == \
+               (other.instance_index, other.property_id, other.data)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", instance_index=" + str(self.instance_index) \
-               + ", property_id=" + str(self.property_id) \
-               + ", data=" + self.data.hex()
+        return f"{super().__str__()}, instance_index={self.instance_index}, property_id={self.property_id}" \
+               f", data={self.data.hex()}"
 
     def get_length(self):
         """
@@ -1200,59 +1129,54 @@ class SensorUpdateRequestMessage(GenericMessage):
         """
         return UART_INSTANCE_INDEX_LEN + UART_PROPERTY_ID_LEN + len(self.data)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.instance_index.to_bytes(UART_INSTANCE_INDEX_LEN, byteorder='little', signed=False))
-        stream.write(self.property_id.to_bytes(UART_PROPERTY_ID_LEN, byteorder='little', signed=False))
-        stream.write(self.data)
+        return _SENSOR_UPDATE_HEADER.pack(_SENSOR_UPDATE_FIXED_LEN + len(self.data), self.type, self.instance_index,
+                                          self.property_id) + self.data
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.instance_index = int.from_bytes(stream.read(UART_INSTANCE_INDEX_LEN), byteorder='little')
-        self.property_id = int.from_bytes(stream.read(UART_PROPERTY_ID_LEN), byteorder='little')
+        length, _, self.instance_index, self.property_id = self.unpack_fixed_part(data, offset, _SENSOR_UPDATE_HEADER)
 
         length -= UART_INSTANCE_INDEX_LEN + UART_PROPERTY_ID_LEN
 
-        self.data = stream.read(length)
+        start = offset + _SENSOR_UPDATE_HEADER.size
+        self.data = data[start:start + length]
 
         if length != len(self.data):
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class AttentionEventMessage(GenericMessage):
+class AttentionEventMessage(_BufferMessage):
     """
     Class representing AttentionEvent uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('attention',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.AttentionEvent
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.AttentionEvent
-        self.attention = AttentionEvent(AttentionEvent.Off)
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.attention = AttentionEvent.Off
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.attention == other.attention
+    def _fields_equal(self, other):
+        return self.attention == other.attention
 
     def __str__(self):
         """
@@ -1268,192 +1192,88 @@ class AttentionEventMessage(GenericMessage):
         """
         return UART_ATTENTION_EVENT_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.attention.to_bytes(UART_ATTENTION_EVENT_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_ATTENTION_EVENT_LEN, self.type, self.attention)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.attention = AttentionEvent.from_bytes(stream.read(UART_ATTENTION_EVENT_LEN), byteorder='little')
+        length, _, attention = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.attention = _ATTENTION_EVENTS[attention]
+
+        if self.attention is None:
+            self.attention = AttentionEvent(attention)
 
         if length - UART_ATTENTION_EVENT_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class SoftResetRequestMessage(GenericMessage):
+class SoftResetRequestMessage(_EmptyBodyMessage):
     """
     Class representing SoftResetRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.SoftResetRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.SoftResetRequest
 
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class SoftResetResponseMessage(GenericMessage):
+class SoftResetResponseMessage(_EmptyBodyMessage):
     """
     Class representing SoftResetResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.SoftResetResponse
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.SoftResetResponse
 
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class SensorUpdateResponseMessage(GenericMessage):
+class SensorUpdateResponseMessage(_EmptyBodyMessage):
     """
     Class representing SensorUpdateResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.SensorUpdateResponse
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.SensorUpdateResponse
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class DeviceUUIDRequestMessage(GenericMessage):
+class DeviceUUIDRequestMessage(_EmptyBodyMessage):
     """
     Class representing DeviceUUIDRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.DeviceUUIDRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.DeviceUUIDRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
-
-
-class DeviceUUIDResponseMessage(GenericMessage):
+class DeviceUUIDResponseMessage(_BufferMessage):
     """
     Class representing DeviceUUIDResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('uuid',)
+    _RECORD = _DEVICE_UUID_RECORD
+    type = UartCommand.DeviceUUIDResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DeviceUUIDResponse
-        self.uuid = bytes(UART_UUID_LEN)
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.uuid = _EMPTY_UUID
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.uuid == other.uuid
+    def _fields_equal(self, other):
+        return self.uuid == other.uuid
 
     def __str__(self):
         """
@@ -1469,71 +1289,59 @@ class DeviceUUIDResponseMessage(GenericMessage):
         """
         return UART_UUID_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.uuid)
+        return _HEADER.pack(UART_UUID_LEN, self.type) + self.uuid
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.uuid = stream.read(UART_UUID_LEN)
+        length, _, self.uuid = self.unpack_fixed_part(data, offset, _DEVICE_UUID_HEADER)
 
         if length - UART_UUID_LEN != 0:
             raise InvalidLen
 
-        if len(self.uuid) - UART_UUID_LEN != 0:
-            raise InvalidLen
+        return offset + _HEADER.size + data[offset]
 
 
-class DfuInitRequestMessage(GenericMessage):
+class DfuInitRequestMessage(_BufferMessage):
     """
     Class representing DfuInitRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('firmware_size', 'firmware_sha256', 'app_data_length', 'app_data')
+    type = UartCommand.DfuInitRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuInitRequest
         self.firmware_size = int()
-        self.firmware_sha256 = bytes(UART_DFU_FIRMWARE_SHA256_LEN)
+        self.firmware_sha256 = _EMPTY_SHA256
         self.app_data_length = int()
-        self.app_data = bytes()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.app_data = b""
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.firmware_size == other.firmware_size and \
-               self.firmware_sha256 == other.firmware_sha256 and \
-               self.app_data_length == other.app_data_length and \
-               self.app_data == other.app_data
+    def _fields_equal(self, other):
+        return (self.firmware_size, self.firmware_sha256, self.app_data_length, self.app_data) == \
+               (other.firmware_size, other.firmware_sha256, other.app_data_length, other.app_data)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", firmware_size=" + str(self.firmware_size) \
-               + ", firmware_sha256=" + self.firmware_sha256.hex() \
-               + ", app_data_length=" + str(self.app_data_length) \
-               + ", app_data=" + self.app_data.hex()
+        return f"{super().__str__()}, firmware_size={self.firmware_size}" \
+               f", firmware_sha256={self.firmware_sha256.hex()}" \
+               f", app_data_length={self.app_data_length}, app_data={self.app_data.hex()}"
 
     def get_length(self):
         """
@@ -1546,64 +1354,59 @@ class DfuInitRequestMessage(GenericMessage):
                UART_DFU_APP_DATA_LENGTH_LEN + \
                len(self.app_data)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.firmware_size.to_bytes(UART_DFU_FIRMWARE_SIZE_LEN, byteorder='little', signed=False))
-        stream.write(self.firmware_sha256)
-        stream.write(self.app_data_length.to_bytes(UART_DFU_APP_DATA_LENGTH_LEN, byteorder='little', signed=False))
-        stream.write(self.app_data)
+        return _DFU_INIT_HEADER.pack(_DFU_INIT_FIXED_LEN + len(self.app_data), self.type, self.firmware_size,
+                                     self.firmware_sha256, self.app_data_length) + self.app_data
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.firmware_size = int.from_bytes(stream.read(UART_DFU_FIRMWARE_SIZE_LEN), byteorder='little')
-        self.firmware_sha256 = stream.read(UART_DFU_FIRMWARE_SHA256_LEN)
-        self.app_data_length = int.from_bytes(stream.read(UART_DFU_APP_DATA_LENGTH_LEN), byteorder='little')
+        length, _, self.firmware_size, self.firmware_sha256, self.app_data_length = \
+            self.unpack_fixed_part(data, offset, _DFU_INIT_HEADER)
 
         length -= UART_DFU_FIRMWARE_SIZE_LEN + UART_DFU_FIRMWARE_SHA256_LEN + UART_DFU_APP_DATA_LENGTH_LEN
 
         if length != self.app_data_length:
             raise InvalidLen
 
-        self.app_data = stream.read(length)
+        start = offset + _DFU_INIT_HEADER.size
+        end = start + length
+        self.app_data = data[start:end]
 
-        if self.app_data_length != len(self.app_data):
+        if len(self.app_data) != length:
             raise InvalidLen
 
+        return end
+
 
-class DfuInitResponseMessage(GenericMessage):
+class DfuInitResponseMessage(_BufferMessage):
     """
     Class representing DfuInitResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('status',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.DfuInitResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuInitResponse
-        self.status = DFUStatus(DFUStatus.DFU_INVALID_CODE)
+        self.status = DFUStatus.DFU_INVALID_CODE
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.status == other.status
+    def _fields_equal(self, other):
+        return self.status == other.status
 
     def __str__(self):
         """
@@ -1611,111 +1414,80 @@ class DfuInitResponseMessage(GenericMessage):
         """
         return super().__str__() + ", status=" + self.status.name
 
-    def get_length(self):
-        """
-        Get serialized message len. This should be used ONLY when all fields are filled
-
-        :return:    int, serialized message length
-        """
-        return UART_DFU_STATUS_LEN
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-        stream.write(self.status.to_bytes(UART_DFU_STATUS_LEN, byteorder='little', signed=False))
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-        self.status = DFUStatus.from_bytes(stream.read(UART_DFU_STATUS_LEN), byteorder='little')
-
-        if length - UART_DFU_STATUS_LEN != 0:
-            raise InvalidLen
-
-
-class DfuStatusRequestMessage(GenericMessage):
-    """
-    Class representing DfuStatusRequest uart message.
-    Class fields are adequate to message parameters, described in UART specification.
-    """
-
-    def __init__(self):
+    def get_length(self):
         """
-        Initialize message and all its fields
+        Get serialized message len. This should be used ONLY when all fields are filled
+
+        :return:    int, serialized message length
         """
-        super().__init__()
-        self.type = UartCommand.DfuStatusRequest
+        return UART_DFU_STATUS_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
+        return _HEADER_U8.pack(UART_DFU_STATUS_LEN, self.type, self.status)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
+        length, _, status = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.status = _DFU_STATUSES[status]
 
-        if length != 0:
+        if self.status is None:
+            self.status = DFUStatus(status)
+
+        if length - UART_DFU_STATUS_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
+
+class DfuStatusRequestMessage(_EmptyBodyMessage):
+    """
+    Class representing DfuStatusRequest uart message.
+    Class fields are adequate to message parameters, described in UART specification.
+    """
+    __slots__ = ()
+    type = UartCommand.DfuStatusRequest
+
 
-class DfuStatusResponseMessage(GenericMessage):
+class DfuStatusResponseMessage(_BufferMessage):
     """
     Class representing DfuStatusResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('status', 'supported_page_size', 'firmware_offset', 'firmware_crc')
+    _RECORD = _DFU_STATUS_RESPONSE_RECORD
+    type = UartCommand.DfuStatusResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuStatusResponse
-        self.status = DFUStatus(DFUStatus.DFU_INVALID_CODE)
+        self.status = DFUStatus.DFU_INVALID_CODE
         self.supported_page_size = int()
         self.firmware_offset = int()
         self.firmware_crc = int()
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.status == other.status and \
-               self.supported_page_size == other.supported_page_size and \
-               self.firmware_offset == other.firmware_offset and \
-               self.firmware_crc == other.firmware_crc
+    def _fields_equal(self, other):
+        return (self.status, self.supported_page_size, self.firmware_offset, self.firmware_crc) == \
+               (other.status, other.supported_page_size, other.firmware_offset, other.firmware_crc)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", status=" + self.status.name \
-               + ", supported_page_size=" + str(self.supported_page_size) \
-               + ", firmware_offset=" + hex(self.firmware_offset) \
-               + ", firmware_crc=" + hex(self.firmware_crc)
+        return f"{super().__str__()}, status={self.status.name}, supported_page_size={self.supported_page_size}" \
+               f", firmware_offset={self.firmware_offset:#x}, firmware_crc={self.firmware_crc:#x}"
 
     def get_length(self):
         """
@@ -1728,32 +1500,29 @@ class DfuStatusResponseMessage(GenericMessage):
                UART_DFU_FIRMWARE_OFFSET_LEN + \
                UART_DFU_FIRMWARE_CRC_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.status.to_bytes(UART_DFU_STATUS_LEN, byteorder='little', signed=False))
-        stream.write(
-            self.supported_page_size.to_bytes(UART_DFU_SUPPORTED_PAGE_SIZE_LEN, byteorder='little', signed=False))
-        stream.write(self.firmware_offset.to_bytes(UART_DFU_FIRMWARE_OFFSET_LEN, byteorder='little', signed=False))
-        stream.write(self.firmware_crc.to_bytes(UART_DFU_FIRMWARE_CRC_LEN, byteorder='little', signed=False))
+        return _DFU_STATUS_RESPONSE_HEADER.pack(_DFU_STATUS_RESPONSE_FIXED_LEN, self.type, self.status,
+                                                self.supported_page_size, self.firmware_offset, self.firmware_crc)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.status = DFUStatus.from_bytes(stream.read(UART_DFU_STATUS_LEN), byteorder='little')
-        self.supported_page_size = int.from_bytes(stream.read(UART_DFU_SUPPORTED_PAGE_SIZE_LEN), byteorder='little')
-        self.firmware_offset = int.from_bytes(stream.read(UART_DFU_FIRMWARE_OFFSET_LEN), byteorder='little')
-        self.firmware_crc = int.from_bytes(stream.read(UART_DFU_FIRMWARE_CRC_LEN), byteorder='little')
+        length, _, status, self.supported_page_size, self.firmware_offset, self.firmware_crc = \
+            self.unpack_fixed_part(data, offset, _DFU_STATUS_RESPONSE_HEADER)
+        self.status = _DFU_STATUSES[status]
+
+        if self.status is None:
+            self.status = DFUStatus(status)
 
         if length - \
            UART_DFU_STATUS_LEN - \
@@ -1762,29 +1531,37 @@ class DfuStatusResponseMessage(GenericMessage):
            UART_DFU_FIRMWARE_CRC_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
+    def verify_firmware(self, firmware):
+        """
+        Check reported firmware CRC against firmware image. CRC-32 of the first firmware_offset bytes of image is
+        computed by zlib.crc32, in C and without copying image slice
+
+        :param firmware:    bytes-like object, firmware image being transferred. Image is sliced by bytes, also if its
+                            items are larger, e.g. array.array('H')
+        :return:            True if CRC of already transferred part of image matches firmware_crc, False otherwise
+        """
+        return zlib.crc32(memoryview(firmware).cast('B')[:self.firmware_offset]) == self.firmware_crc
+
 
-class DfuPageCreateRequestMessage(GenericMessage):
+class DfuPageCreateRequestMessage(_BufferMessage):
     """
     Class representing DfuPageCreateRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('requested_page_size',)
+    type = UartCommand.DfuPageCreateRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuPageCreateRequest
         self.requested_page_size = int()
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.requested_page_size == other.requested_page_size
+    def _fields_equal(self, other):
+        return self.requested_page_size == other.requested_page_size
 
     def __str__(self):
         """
@@ -1800,52 +1577,48 @@ class DfuPageCreateRequestMessage(GenericMessage):
         """
         return UART_REQUESTED_PAGE_SIZE_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.requested_page_size.to_bytes(UART_REQUESTED_PAGE_SIZE_LEN, byteorder='little', signed=False))
+        return _HEADER_U32.pack(UART_REQUESTED_PAGE_SIZE_LEN, self.type, self.requested_page_size)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.requested_page_size = int.from_bytes(stream.read(UART_REQUESTED_PAGE_SIZE_LEN), byteorder='little')
+        length, _, self.requested_page_size = self.unpack_fixed_part(data, offset, _HEADER_U32)
 
         if length - UART_REQUESTED_PAGE_SIZE_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class DfuPageCreateResponseMessage(GenericMessage):
+
+class DfuPageCreateResponseMessage(_BufferMessage):
     """
     Class representing DfuPageCreateResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('status',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.DfuPageCreateResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuPageCreateResponse
-        self.status = DFUStatus(DFUStatus.DFU_INVALID_CODE)
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.status = DFUStatus.DFU_INVALID_CODE
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.status == other.status
+    def _fields_equal(self, other):
+        return self.status == other.status
 
     def __str__(self):
         """
@@ -1861,62 +1634,58 @@ class DfuPageCreateResponseMessage(GenericMessage):
         """
         return UART_DFU_STATUS_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.status.to_bytes(UART_DFU_STATUS_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_DFU_STATUS_LEN, self.type, self.status)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.status = DFUStatus.from_bytes(stream.read(UART_DFU_STATUS_LEN), byteorder='little')
+        length, _, status = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.status = _DFU_STATUSES[status]
+
+        if self.status is None:
+            self.status = DFUStatus(status)
 
         if length - UART_DFU_STATUS_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class DfuWriteDataEventMessage(GenericMessage):
+
+class DfuWriteDataEventMessage(_BufferMessage):
     """
     Class representing DfuWriteDataEvent uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('data_len', 'data')
+    type = UartCommand.DfuWriteDataEvent
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuWriteDataEvent
         self.data_len = int()
-        self.data = bytes()
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.data = b""
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.data_len == other.data_len and \
-               self.data == other.data
+    def _fields_equal(self, other):
+        return (self.data_len, self.data) == (other.data_len, other.data)
 
     def __str__(self):
         """
         Generate string representing message
         """
-        return super().__str__() + ", data_len=" + str(self.data_len) \
-               + ", data=" + self.data.hex()
+        return f"{super().__str__()}, data_len={self.data_len}, data={self.data.hex()}"
 
     def get_length(self):
         """
@@ -1926,95 +1695,66 @@ class DfuWriteDataEventMessage(GenericMessage):
         """
         return UART_DFU_DATA_LENGTH_LEN + len(self.data)
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.data_len.to_bytes(UART_DFU_DATA_LENGTH_LEN, byteorder='little', signed=False))
-        stream.write(self.data)
+        return _HEADER_U8.pack(UART_DFU_DATA_LENGTH_LEN + len(self.data), self.type, self.data_len) + self.data
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.data_len = int.from_bytes(stream.read(UART_DFU_DATA_LENGTH_LEN), byteorder='little')
+        length, _, self.data_len = self.unpack_fixed_part(data, offset, _HEADER_U8)
 
         length -= UART_DFU_DATA_LENGTH_LEN
 
         if length != self.data_len:
             raise InvalidLen
 
-        self.data = stream.read(length)
+        start = offset + _HEADER_U8.size
+        end = start + length
+        self.data = data[start:end]
 
-        if self.data_len != len(self.data):
+        if len(self.data) != length:
             raise InvalidLen
 
+        return end
+
 
-class DfuPageStoreRequestMessage(GenericMessage):
+class DfuPageStoreRequestMessage(_EmptyBodyMessage):
     """
     Class representing DfuPageStoreRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.DfuPageStoreRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.DfuPageStoreRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
 
-
-class DfuPageStoreResponseMessage(GenericMessage):
+class DfuPageStoreResponseMessage(_BufferMessage):
     """
     Class representing DfuPageStoreResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('status',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.DfuPageStoreResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuPageStoreResponse
-        self.status = DFUStatus(DFUStatus.DFU_INVALID_CODE)
-
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
+        self.status = DFUStatus.DFU_INVALID_CODE
 
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.status == other.status
+    def _fields_equal(self, other):
+        return self.status == other.status
 
     def __str__(self):
         """
@@ -2030,78 +1770,58 @@ class DfuPageStoreResponseMessage(GenericMessage):
         """
         return UART_DFU_STATUS_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.status.to_bytes(UART_DFU_STATUS_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_DFU_STATUS_LEN, self.type, self.status)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.status = DFUStatus.from_bytes(stream.read(UART_DFU_STATUS_LEN), byteorder='little')
+        length, _, status = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.status = _DFU_STATUSES[status]
+
+        if self.status is None:
+            self.status = DFUStatus(status)
 
         if length - UART_DFU_STATUS_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class DfuStateRequestMessage(GenericMessage):
+
+class DfuStateRequestMessage(_EmptyBodyMessage):
     """
     Class representing DfuStateRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
-
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.DfuStateRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
+    __slots__ = ()
+    type = UartCommand.DfuStateRequest
 
 
-class DfuStateResponseMessage(GenericMessage):
+class DfuStateResponseMessage(_BufferMessage):
     """
     Class representing DfuStateResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('status',)
+    _RECORD = _U8_RECORD
+    type = UartCommand.DfuStateResponse
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.DfuStateResponse
-        self.status = DfuStatus(DfuStatus.NotInProgress)
+        self.status = DfuStatus.NotInProgress
 
     def __str__(self):
         """
@@ -2109,14 +1829,8 @@ class DfuStateResponseMessage(GenericMessage):
         """
         return super().__str__() + ", status=" + self.status.name
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and self.status == other.status
+    def _fields_equal(self, other):
+        return self.status == other.status
 
     def get_length(self):
         """
@@ -2126,128 +1840,72 @@ class DfuStateResponseMessage(GenericMessage):
         """
         return UART_DFU_PRE_VALIDATION_STATUS_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.status.to_bytes(UART_DFU_PRE_VALIDATION_STATUS_LEN, byteorder='little', signed=False))
+        return _HEADER_U8.pack(UART_DFU_PRE_VALIDATION_STATUS_LEN, self.type, self.status)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.status = DfuStatus.from_bytes(stream.read(UART_DFU_PRE_VALIDATION_STATUS_LEN),
-                                           byteorder='little')
+        length, _, status = self.unpack_fixed_part(data, offset, _HEADER_U8)
+        self.status = _DFU_PRE_VALIDATION_STATUSES[status]
+
+        if self.status is None:
+            self.status = DfuStatus(status)
 
         if length - UART_DFU_PRE_VALIDATION_STATUS_LEN != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
+
 
-class DfuCancelRequestMessage(GenericMessage):
+class DfuCancelRequestMessage(_EmptyBodyMessage):
     """
     Class representing DfuCancelRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ()
+    type = UartCommand.DfuCancelRequest
 
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.DfuCancelRequest
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
 
-
-class DfuCancelResponseMessage(GenericMessage):
+class DfuCancelResponseMessage(_EmptyBodyMessage):
     """
     Class representing DfuCancelResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
-
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.DfuCancelResponse
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
+    __slots__ = ()
+    type = UartCommand.DfuCancelResponse
 
 
-class StartTestRequest(GenericMessage):
+class StartTestRequest(_BufferMessage):
     """
     Class representing StartTestRequest uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
+    __slots__ = ('company_id', 'test_id', 'instance_index')
+    type = UartCommand.StartTestRequest
 
     def __init__(self):
         """
         Initialize message and all its fields
         """
         super().__init__()
-        self.type = UartCommand.StartTestRequest
         self.company_id = 0
         self.test_id = 0
         self.instance_index = 0
 
-    def __eq__(self, other):
-        """
-        Compare two messages. Returns true if all fields are identical.
-
-        :param other:     GenericMessage or derivative, other message to be compared with self
-        :return:          True if identical, False otherwise
-        """
-        return super().__eq__(other) and \
-               self.company_id == other.company_id and \
-               self.test_id == other.test_id and \
-               self.instance_index == other.instance_index
+    def _fields_equal(self, other):
+        return (self.company_id, self.test_id, self.instance_index) == \
+               (other.company_id, other.test_id, other.instance_index)
 
     def get_length(self):
         """
@@ -2257,74 +1915,38 @@ class StartTestRequest(GenericMessage):
         """
         return UART_COMPANY_ID_LEN + UART_TEST_ID_LEN + UART_INSTANCE_INDEX_LEN
 
-    def serialize(self, stream):
+    def serialize_to_bytes(self):
         """
         Serialize message into bytes
 
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
+        :return:    bytes, serialized message
         """
-        self.serialize_common_part(stream)
-        stream.write(self.company_id.to_bytes(UART_COMPANY_ID_LEN, byteorder='little', signed=False))
-        stream.write(self.test_id.to_bytes(UART_TEST_ID_LEN, byteorder='little', signed=False))
-        stream.write(self.instance_index.to_bytes(UART_INSTANCE_INDEX_LEN, byteorder='little', signed=False))
+        return _START_TEST_HEADER.pack(_START_TEST_FIXED_LEN, self.type, self.company_id, self.test_id,
+                                       self.instance_index)
 
-    def deserialize(self, stream):
+    def deserialize_from_buffer(self, data, offset=0):
         """
-        Deserialize message, fill fields consuming stream
+        Deserialize message from buffer, fill fields without intermediate stream
 
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
+        :param data:    bytes, buffer containing serialized message
+        :param offset:  int, position of serialized message in buffer
+        :return:        int, position of the first byte following message
         """
-        length = self.deserialize_common_part(stream)
-        self.company_id = int.from_bytes(stream.read(UART_COMPANY_ID_LEN), byteorder="little")
-        self.test_id = int.from_bytes(stream.read(UART_TEST_ID_LEN), byteorder="little")
-        self.instance_index = int.from_bytes(stream.read(UART_INSTANCE_INDEX_LEN), byteorder="little")
+        length, _, self.company_id, self.test_id, self.instance_index = \
+            self.unpack_fixed_part(data, offset, _START_TEST_HEADER)
 
         length -= UART_COMPANY_ID_LEN + UART_TEST_ID_LEN + UART_INSTANCE_INDEX_LEN
 
         if length != 0:
             raise InvalidLen
 
+        return offset + _HEADER.size + data[offset]
 
-class StartTestResponse(GenericMessage):
+
+class StartTestResponse(_EmptyBodyMessage):
     """
     Class representing StartTestResponse uart message.
     Class fields are adequate to message parameters, described in UART specification.
     """
-
-    def __init__(self):
-        """
-        Initialize message and all its fields
-        """
-        super().__init__()
-        self.type = UartCommand.StartTestResponse
-
-    def get_length(self):
-        """
-        Get serialized message len. This should be used ONLY when all fields are filled
-
-        :return:    int, serialized message length
-        """
-        return 0
-
-    def serialize(self, stream):
-        """
-        Serialize message into bytes
-
-        :param stream:  io.BytesIO stream, destination
-        :return:        None
-        """
-        self.serialize_common_part(stream)
-
-    def deserialize(self, stream):
-        """
-        Deserialize message, fill fields consuming stream
-
-        :param stream:  io.BytesIO stream, source stream to read from
-        :return:        None
-        """
-        length = self.deserialize_common_part(stream)
-
-        if length != 0:
-            raise InvalidLen
+    __slots__ = ()
+    type = UartCommand.StartTestResponse
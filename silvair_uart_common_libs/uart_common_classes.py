@@ -1,18 +1,30 @@
 import logging
 import queue
+import struct
 import threading
-import time
 import crcmod
 import serial
 
 LOGGER = logging.getLogger(__name__)
 
+_CRC = struct.Struct('<H')
+
+# Data types accepted by frame writing and checksum helpers
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+# Frame checksum: polynomial 0x8005, init value 0xFFFF. Built once, as building it computes the whole CRC table
+_crc16 = crcmod.mkCrcFun(0x18005, rev=False, initCrc=0xFFFF, xorOut=0x0000)
+
 
 class UartConnectionThread(threading.Thread):
     """
     Class responsible for handling UART connection (sending and receiving data).
     """
 
+    # Upper limit of read timeout while thread runs, so idle thread blocks in serial driver instead of spinning, while
+    # data queued without wake_up waits for sending at most this long. Longer or no configured timeout is replaced
+    READ_TIMEOUT_S = 0.01
+
     def __init__(self, _serial, in_queue, out_queue):
         """
         Initializes UART connection thread class.
@@ -41,12 +53,22 @@ class UartConnectionThread(threading.Thread):
 
         self._serial.apply_settings(settings)
 
+    def wake_up(self):
+        """
+        Interrupts pending read, so data just put into out_queue is sent without waiting for read timeout.
+        Ports without cancel_read are left to time out.
+        """
+        cancel_read = getattr(self._serial, "cancel_read", None)
+        if cancel_read is not None:
+            cancel_read()
+
     def stop(self):
         """
         Stops UART connection thread.
         """
         try:
             self._serial_busy.clear()
+            self.wake_up()
             self.join()
         except RuntimeError as e:
             LOGGER.info("Tried to stop UartConnectionThread before it is started. An error occurred: %s", e)
@@ -60,19 +82,36 @@ class UartConnectionThread(threading.Thread):
         self._serial.reset_input_buffer()
         self._serial.reset_output_buffer()
 
+        # Configured timeout is capped only while thread runs and restored afterwards
+        configured_timeout = self._serial.timeout
+        if not configured_timeout or configured_timeout > self.READ_TIMEOUT_S:
+            self._serial.timeout = self.READ_TIMEOUT_S
+
+        try:
+            self._transfer_data()
+        finally:
+            self._serial.timeout = configured_timeout
+
+    def _transfer_data(self):
+        """
+        Send and receive data over the UART until thread is stopped.
+        """
         data_to_be_sent = bytearray()
 
         while self._serial_busy.is_set():
-            if not data_to_be_sent and not self._out_queue.empty():
-                data_to_be_sent = self._out_queue.get_nowait()
+            while not self._out_queue.empty():
+                data_to_be_sent += self._out_queue.get_nowait()
 
             if data_to_be_sent:
                 sent_bytes_n = self._serial.write(data_to_be_sent)
-                data_to_be_sent = data_to_be_sent[sent_bytes_n:]
 
-            self._in_queue.put(self._serial.read_all())
+                # Sent bytes are dropped after every write, so buffer holds only pending data under steady traffic.
+                # Some serial backends return None instead of number of written bytes, then whole buffer was written
+                del data_to_be_sent[:len(data_to_be_sent) if sent_bytes_n is None else sent_bytes_n]
 
-            time.sleep(0.001)  # Needed on Linux. Otherwise CPU utilization 100% is observed.
+            received_data = self._serial.read(self._serial.in_waiting or 1)
+            if received_data:
+                self._in_queue.put(received_data)
 
 
 def create_uart_connection_thread(in_queue, out_queue, port, baudrate=56700, timeout_s=0, write_timeout_s=0):
@@ -83,7 +122,8 @@ def create_uart_connection_thread(in_queue, out_queue, port, baudrate=56700, tim
     :param out_queue: queue.Queue, queue with bytes that will be sent.
     :param port: str, UART com port name
     :param baudrate: int, UART baudrate
-    :param timeout_s: int, timeout for receiving data from UART
+    :param timeout_s: int, timeout for receiving data from UART. While thread runs, it is capped at
+                      UartConnectionThread.READ_TIMEOUT_S, and 0 or None is replaced with it
     :param write_timeout_s: int, timeout for sendin data over UART
     :return: UartConnectionThread object
     """
@@ -131,7 +171,7 @@ class UartAdapter(threading.Thread):
 
         :param port:            COM port to be used
         :param baud_rate:       UART baudrate
-        :param timeout_s:       UART connection timeout
+        :param timeout_s:       UART connection timeout, capped at UartConnectionThread.READ_TIMEOUT_S while running
         :param write_timeout_s: UART connection write timeout
         """
         super().__init__()
@@ -198,18 +238,19 @@ class UartAdapter(threading.Thread):
         """
         Writes uart_frame directly to serial buffer
 
-        :param uart_frame: bytes with raw data (without preamble and crc)
+        :param uart_frame: bytes, bytearray or memoryview with raw data (without preamble and crc)
         :param send_raw: bool, if set to True will send raw bytes else will append preamble and crc
         """
-        assert type(uart_frame) in [bytes], "Given data type for creating uart frame: '{}' is invalid. " \
-                                            "Expected bytes.".format(type(uart_frame))
+        assert type(uart_frame) in _BYTES_TYPES, \
+            "Given data type for creating uart frame: '{}' is invalid. Expected bytes, bytearray or memoryview.".format(
+                type(uart_frame))
 
         if send_raw:
-            frame_to_send = uart_frame
+            frame_to_send = bytes(uart_frame)
         else:
-            crc = UartAdapter.calculate_crc_bytes(uart_frame)
-            frame_to_send = UartAdapter.UART_PREAMBLE + uart_frame + crc
+            frame_to_send = b"".join((UartAdapter.UART_PREAMBLE, uart_frame, _CRC.pack(_crc16(uart_frame))))
         self._out_queue.put(frame_to_send)
+        self._uart_conn.wake_up()
 
     def stop(self):
         """
@@ -238,7 +279,13 @@ class UartAdapter(threading.Thread):
             try:
                 not_processed_buffer_data += self._in_queue.get(timeout=0.1)
 
-                frames, not_processed_buffer_data = UartAdapter.extract_frames(not_processed_buffer_data)
+                # Drain chunks queued meanwhile, so whole burst is parsed with single extract_frames call
+                while not self._in_queue.empty():
+                    not_processed_buffer_data += self._in_queue.get_nowait()
+
+                # Consumed bytes are deleted from the front in place, so remaining partial frame is not copied
+                frames, consumed_bytes_n = UartAdapter._scan_frames(not_processed_buffer_data)
+                del not_processed_buffer_data[:consumed_bytes_n]
                 for frame in frames:
                     self._insert_parsed_frame(frame)
 
@@ -251,34 +298,56 @@ class UartAdapter(threading.Thread):
         Extract single-message-frames (without preamble and crc) from raw uart data.
 
         :param raw_uart_data:   bytes, bytearray    Raw uart data
-        :return:                tuple:  list of extracted uart frames, bytes remaining data
+        :return:                tuple:  list of extracted uart frames, bytearray remaining data
+        """
+        uart_frames, consumed_bytes_n = UartAdapter._scan_frames(raw_uart_data)
+        return uart_frames, bytearray(raw_uart_data[consumed_bytes_n:])
+
+    @staticmethod
+    def _scan_frames(raw_uart_data):
+        """
+        Extract single-message-frames (without preamble and crc) from raw uart data, without copying remaining data.
+        Frames are found by advancing offset over single memoryview of data, so only accepted frames are copied.
+        Orphaned bytes before preamble are skipped. Data without any preamble is consumed too, except trailing first
+        byte of preamble, so noise does not accumulate in receive buffer.
+
+        :param raw_uart_data:   bytes, bytearray    Raw uart data
+        :return:                tuple:  list of extracted uart frames, int number of consumed leading bytes
         """
         uart_frames = list()
-        raw_uart_data = UartAdapter.eat_bytes_until_preamble(raw_uart_data)
+        frame_start = 0
 
-        if len(raw_uart_data) < 6:
-            return uart_frames, raw_uart_data
+        with memoryview(raw_uart_data) as data:
+            while True:
+                preamble_start = raw_uart_data.find(UartAdapter.UART_PREAMBLE, frame_start)
+                if preamble_start < 0:
+                    # Trailing first byte of preamble is kept, as rest of preamble may follow
+                    orphaned_end = len(data) - 1 if data[-1:] == UartAdapter.UART_PREAMBLE[:1] else len(data)
+                    if orphaned_end > frame_start:
+                        LOGGER.warning("Removed orphaned bytes: %s", bytes(data[frame_start:orphaned_end]))
+                        frame_start = orphaned_end
+                    break
 
-        data_len = int.from_bytes(raw_uart_data[2:3], byteorder='little', signed=False)
-        if len(raw_uart_data) < 6 + data_len:
-            return uart_frames, raw_uart_data
+                if preamble_start != frame_start:
+                    LOGGER.warning("Removed orphaned bytes: %s", bytes(data[frame_start:preamble_start]))
+                    frame_start = preamble_start
 
-        uart_frame = raw_uart_data[:4 + data_len + 2]
-        remaining_data = raw_uart_data[6 + data_len:]
-        expected_crc = UartAdapter.calculate_crc(uart_frame[2:4 + data_len])
-        actual_crc = int.from_bytes(uart_frame[len(uart_frame) - 2:], byteorder='little',
-                                    signed=False)
+                if len(data) - frame_start < 6:
+                    break
 
-        uart_frame_no_preamble_and_crc = uart_frame[2:len(uart_frame) - 2]
+                data_len = data[frame_start + 2]
+                frame_end = frame_start + 6 + data_len
+                if len(data) < frame_end:
+                    break
 
-        if expected_crc == actual_crc:
-            uart_frames.append(uart_frame_no_preamble_and_crc)
-            if len(remaining_data) > 0:
-                another_frames, remaining_data = UartAdapter.extract_frames(remaining_data)
-                uart_frames.extend(another_frames)
-            return uart_frames, remaining_data
-        else:
-            return uart_frames, remaining_data
+                expected_crc = _crc16(data[frame_start + 2:frame_end - 2])
+                actual_crc = data[frame_end - 2] | (data[frame_end - 1] << 8)
+
+                if expected_crc == actual_crc:
+                    uart_frames.append(bytes(data[frame_start + 2:frame_end - 2]))
+                frame_start = frame_end
+
+        return uart_frames, frame_start
 
     @staticmethod
     def calculate_crc(bytes_data):
@@ -288,39 +357,41 @@ class UartAdapter(threading.Thread):
         - polynomial = 0x8005
         - init value = 0xFFFF
 
-        :param bytes_data:  bytes type data for calculating checksum
+        :param bytes_data:  bytes, bytearray or memoryview data for calculating checksum
         :return:            int, checksum
         """
-        _checksum_function = crcmod.mkCrcFun(0x18005, rev=False, initCrc=0xFFFF, xorOut=0x0000)
-        assert type(bytes_data) == bytes or type(
-            bytes_data) == bytearray, "Given invalid data type '{}', expected 'bytes'".format(type(bytes_data))
-        checksum = _checksum_function(bytes_data)
-        return checksum
+        assert type(bytes_data) in _BYTES_TYPES, \
+            "Given invalid data type '{}', expected 'bytes', 'bytearray' or 'memoryview'".format(type(bytes_data))
+        return _crc16(bytes_data)
 
     @staticmethod
     def calculate_crc_bytes(bytes_data):
         """
         Calculates checksum for given series of bytes
 
-        :param bytes_data: bytes type data for calculating checksum
+        :param bytes_data: bytes, bytearray or memoryview data for calculating checksum
         :return: bytes, checksum
         """
-        return UartAdapter.calculate_crc(bytes_data).to_bytes(2, byteorder='little', signed=False)
+        return _CRC.pack(UartAdapter.calculate_crc(bytes_data))
 
     @staticmethod
     def eat_bytes_until_preamble(buffer_data):
         """
-        Removes bytes from received data until preamble indicating a new frame is found.
+        Removes bytes from received data until preamble indicating a new frame is found. Preamble is searched with
+        single find call and deleted at once. Bytearray is trimmed in place and returned, immutable bytes input is
+        returned as new trimmed object.
 
         :param buffer_data: bytearray with raw data obtained from the serial port buffer
         :return: bytearray with raw data, with preamble on first bytes (or all raw data, if there was no preamble in
         the buffer).
         """
-        orphaned_bytes = bytearray()
-        while len(buffer_data) > 0 and buffer_data[:2] != bytearray(UartAdapter.UART_PREAMBLE):
-            orphaned_bytes.append(buffer_data.pop(0))
-        if len(orphaned_bytes) > 0:
-            if len(buffer_data) == 0:
-                return orphaned_bytes
-            print("Removed orphaned bytes: {}".format(orphaned_bytes))
+        preamble_start = buffer_data.find(UartAdapter.UART_PREAMBLE)
+        if preamble_start <= 0:
+            return buffer_data
+
+        LOGGER.warning("Removed orphaned bytes: %s", bytes(buffer_data[:preamble_start]))
+        if type(buffer_data) is not bytearray:
+            return buffer_data[preamble_start:]
+
+        del buffer_data[:preamble_start]
         return buffer_data
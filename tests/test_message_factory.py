@@ -1,7 +1,9 @@
+import io
 import unittest
 
 from silvair_uart_common_libs import message_factory
-from silvair_uart_common_libs.messages import UartCommand, PingRequestMessage, PongResponseMessage
+from silvair_uart_common_libs.messages import UartCommand, PingRequestMessage, PongResponseMessage, InvalidOpcode, \
+    InvalidLen, GenericMessage
 
 
 class PingRequestMessageFactoryTests(unittest.TestCase):
@@ -10,8 +12,8 @@ class PingRequestMessageFactoryTests(unittest.TestCase):
 
         msg = message_factory.deserialize_message(bytes)
 
-        self.assertEquals(msg.type, UartCommand.PingRequest)
-        self.assertEquals(msg.data, b'\xAA')
+        self.assertEqual(msg.type, UartCommand.PingRequest)
+        self.assertEqual(msg.data, b'\xAA')
 
     def test_ping_request_serialize_valid(self):
         msg = PingRequestMessage()
@@ -20,7 +22,7 @@ class PingRequestMessageFactoryTests(unittest.TestCase):
 
         bytes = message_factory.serialize_message(msg)
 
-        self.assertEquals(expected_output, bytes)
+        self.assertEqual(expected_output, bytes)
 
 
 class PongResponseMessageFactoryTests(unittest.TestCase):
@@ -29,8 +31,8 @@ class PongResponseMessageFactoryTests(unittest.TestCase):
 
         msg = message_factory.deserialize_message(bytes)
 
-        self.assertEquals(msg.type, UartCommand.PongResponse)
-        self.assertEquals(msg.data, b'\xAA')
+        self.assertEqual(msg.type, UartCommand.PongResponse)
+        self.assertEqual(msg.data, b'\xAA')
 
     def test_ping_request_serialize_valid(self):
         msg = PongResponseMessage()
@@ -39,4 +41,114 @@ class PongResponseMessageFactoryTests(unittest.TestCase):
 
         bytes = message_factory.serialize_message(msg)
 
-        self.assertEquals(expected_output, bytes)
\ No newline at end of file
+        self.assertEqual(expected_output, bytes)
+
+
+class DispatchMessageFactoryTests(unittest.TestCase):
+    def test_deserialize_unsupported_opcode(self):
+        bytes = b"\x01\x7F\xAA"
+
+        with self.assertRaises(InvalidOpcode) as _:
+            message_factory.deserialize_message(bytes)
+
+    def test_deserialize_generic_opcode(self):
+        bytes = b"\x00\xFF"
+
+        with self.assertRaises(InvalidOpcode) as _:
+            message_factory.deserialize_message(bytes)
+
+        with self.assertRaises(TypeError) as _:
+            GenericMessage()
+
+    def test_deserialize_too_short(self):
+        bytes = b"\x01"
+
+        with self.assertRaises(InvalidLen) as _:
+            message_factory.deserialize_message(bytes)
+
+    def test_deserialize_mutable_buffer(self):
+        buffer = bytearray(b"\x01\x01\xAA")
+
+        msg = message_factory.deserialize_message(buffer)
+        buffer[2] = 0xBB
+
+        self.assertEqual(msg.type, UartCommand.PingRequest)
+        self.assertIs(type(msg.data), bytes)
+        self.assertEqual(msg.data, b'\xAA')
+
+    def test_deserialize_memoryview(self):
+        buffer = bytearray(b"\xFF\x01\x01\xAA\xFF")
+
+        msg = message_factory.deserialize_message(memoryview(buffer)[1:4])
+        buffer[3] = 0xBB
+
+        self.assertEqual(msg.type, UartCommand.PingRequest)
+        self.assertIs(type(msg.data), bytes)
+        self.assertEqual(msg.data, b'\xAA')
+
+    def test_deserialize_stateless_shared(self):
+        msg_1 = message_factory.deserialize_message(b"\x00\x09")
+        msg_2 = message_factory.deserialize_message(b"\x00\x09")
+
+        self.assertEqual(msg_1.type, UartCommand.StartNodeRequest)
+        self.assertIs(msg_1, msg_2)
+
+        with self.assertRaises(InvalidLen) as _:
+            message_factory.deserialize_message(b"\x01\x09\xAA")
+
+
+class StreamMessageFactoryTests(unittest.TestCase):
+    def test_deserialize_stream_valid(self):
+        bytes = b"\x01\x01\xAA\x00\x09\x01\x02\xBB"
+
+        msgs = list(message_factory.deserialize_stream(bytes))
+
+        self.assertEqual(len(msgs), 3)
+        self.assertEqual(msgs[0].type, UartCommand.PingRequest)
+        self.assertEqual(msgs[0].data, b'\xAA')
+        self.assertEqual(msgs[1].type, UartCommand.StartNodeRequest)
+        self.assertEqual(msgs[2].type, UartCommand.PongResponse)
+        self.assertEqual(msgs[2].data, b'\xBB')
+
+    def test_deserialize_stream_invalid_truncated(self):
+        bytes = b"\x01\x01\xAA\x02\x02\xBB"
+
+        with self.assertRaises(InvalidLen) as _:
+            list(message_factory.deserialize_stream(bytes))
+
+    def test_read_message_valid(self):
+        stream = io.BytesIO(b"\x01\x01\xAA\x00\x09")
+
+        ping = message_factory.read_message(stream)
+        start_node = message_factory.read_message(stream)
+
+        self.assertEqual(ping.type, UartCommand.PingRequest)
+        self.assertEqual(ping.data, b'\xAA')
+        self.assertEqual(start_node.type, UartCommand.StartNodeRequest)
+        self.assertEqual(stream.read(), b"")
+
+    def test_read_message_unsupported_opcode_consumes_frame(self):
+        stream = io.BytesIO(b"\x01\xEE\xAA\x01\x01\xBB")
+
+        with self.assertRaises(InvalidOpcode) as _:
+            message_factory.read_message(stream)
+
+        self.assertEqual(message_factory.read_message(stream).data, b'\xBB')
+
+    def test_read_message_invalid_truncated(self):
+        with self.assertRaises(InvalidLen) as _:
+            message_factory.read_message(io.BytesIO(b"\x02\x01\xAA"))
+
+        with self.assertRaises(InvalidLen) as _:
+            message_factory.read_message(io.BytesIO(b"\x01"))
+
+    def test_serialize_many_valid(self):
+        ping = PingRequestMessage()
+        ping.data = b'\xAA'
+        pong = PongResponseMessage()
+        pong.data = b'\xBB'
+
+        bytes = message_factory.serialize_many([ping, pong])
+
+        self.assertEqual(bytes, b"\x01\x01\xAA\x01\x02\xBB")
+        self.assertEqual(list(message_factory.deserialize_stream(bytes)), [ping, pong])
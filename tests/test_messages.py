@@ -1,3 +1,4 @@
+import array
 import io
 import unittest
 
@@ -12,7 +13,64 @@ from silvair_uart_common_libs.messages import PingRequestMessage, UartCommand, I
     SensorUpdateRequestMessage, AttentionEventMessage, SoftResetRequestMessage, SoftResetResponseMessage, \
     SensorUpdateResponseMessage, DeviceUUIDRequestMessage, DeviceUUIDResponseMessage, DfuInitRequestMessage, \
     DfuStatusRequestMessage, DfuInitResponseMessage, DfuPageCreateResponseMessage, DfuPageStoreRequestMessage, \
-    DfuPageStoreResponseMessage, DfuStatusResponseMessage, DfuPageCreateRequestMessage, DfuWriteDataEventMessage
+    DfuPageStoreResponseMessage, DfuStatusResponseMessage, DfuPageCreateRequestMessage, DfuWriteDataEventMessage, \
+    GenericMessage
+
+
+class StreamOnlyMessage(GenericMessage):
+    """
+    Message implementing only stream methods, as derivatives written against stream interface do
+    """
+
+    def __init__(self):
+        self.type = UartCommand.PingRequest
+        self.data = b""
+
+    def serialize(self, stream):
+        stream.write(bytes((len(self.data), self.type)) + self.data)
+
+    def deserialize(self, stream):
+        length, opcode = stream.read(2)
+        if opcode != self.type:
+            raise InvalidOpcode
+        self.data = stream.read(length)
+
+
+class StreamOnlyMessageTests(unittest.TestCase):
+    def test_stream_only_message_serialize_to_bytes(self):
+        msg = StreamOnlyMessage()
+        msg.data = b"\xAA"
+
+        self.assertEqual(msg.serialize_to_bytes(), b"\x01\x01\xAA")
+
+    def test_stream_only_message_deserialize_from_buffer(self):
+        msg = StreamOnlyMessage()
+
+        self.assertEqual(msg.deserialize_from_buffer(b"\xFF\x01\x01\xAA\xFF", 1), 4)
+        self.assertEqual(msg.data, b"\xAA")
+        self.assertEqual(StreamOnlyMessage.from_bytes(b"\x01\x01\xBB").data, b"\xBB")
+
+    def test_stream_only_message_common_part(self):
+        msg = StreamOnlyMessage()
+        stream = io.BytesIO()
+        msg.serialize_common_part(stream)
+
+        self.assertEqual(stream.getvalue(), b"\x00\x01")
+        self.assertEqual(msg.deserialize_common_part(io.BytesIO(b"\x01\x01\xAA")), 1)
+
+        with self.assertRaises(InvalidOpcode):
+            msg.deserialize_common_part(io.BytesIO(b"\x01\x02\xAA"))
+
+        with self.assertRaises(InvalidLen):
+            msg.deserialize_common_part(io.BytesIO(b"\x01"))
+
+    def test_message_without_serialization_is_abstract(self):
+        class IncompleteMessage(GenericMessage):
+            def serialize(self, stream):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteMessage()
 
 
 class PingRequestMessageTests(unittest.TestCase):
@@ -22,8 +80,8 @@ class PingRequestMessageTests(unittest.TestCase):
         msg = PingRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.PingRequest)
-        self.assertEquals(msg.data, b'\xAA')
+        self.assertEqual(msg.type, UartCommand.PingRequest)
+        self.assertEqual(msg.data, b'\xAA')
 
     def test_ping_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\xAB\xAA")
@@ -39,6 +97,41 @@ class PingRequestMessageTests(unittest.TestCase):
         with self.assertRaises(InvalidLen) as _:
             msg.deserialize(stream)
 
+    def test_ping_request_deserialize_from_buffer_valid(self):
+        msg = PingRequestMessage()
+
+        offset = msg.deserialize_from_buffer(b"\xFF\x01\x01\xAA\x00\x09", 1)
+
+        self.assertEqual(offset, 4)
+        self.assertEqual(msg.data, b'\xAA')
+
+    def test_ping_request_from_bytes_valid(self):
+        msg = PingRequestMessage.from_bytes(b"\x01\x01\xAA")
+
+        self.assertEqual(msg.data, b'\xAA')
+
+    def test_ping_request_from_bytes_memoryview(self):
+        buffer = bytearray(b"\xFF\x01\x01\xAA\xFF")
+
+        msg = PingRequestMessage.from_bytes(memoryview(buffer)[1:4])
+        buffer[3] = 0xBB
+
+        self.assertIs(type(msg.data), bytes)
+        self.assertEqual(msg.data, b'\xAA')
+
+    def test_ping_request_from_bytes_invalid_opcode(self):
+        with self.assertRaises(InvalidOpcode) as _:
+            PingRequestMessage.from_bytes(b"\x01\x02\xAA")
+
+    def test_ping_request_deserialize_consumes_single_frame(self):
+        stream = io.BytesIO(b"\x01\x01\xAA\x00\x09")
+        msg = PingRequestMessage()
+
+        msg.deserialize(stream)
+
+        self.assertEqual(msg.data, b'\xAA')
+        self.assertEqual(stream.read(), b"\x00\x09")
+
     def test_ping_request_serialize_valid(self):
         msg = PingRequestMessage()
         msg.data = b'\xBB'
@@ -47,7 +140,32 @@ class PingRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
+
+    def test_ping_request_eq(self):
+        msg = PingRequestMessage()
+        msg.data = b"\xAA"
+        other = PingRequestMessage()
+        other.data = b"\xAA"
+
+        self.assertEqual(msg, msg)
+        self.assertEqual(msg, other)
+        self.assertNotEqual(msg, PongResponseMessage())
+        self.assertNotEqual(msg, None)
+        self.assertNotEqual(msg, b"\x01\x01\xAA")
+
+        other.data = b"\xBB"
+        self.assertNotEqual(msg, other)
+
+    def test_ping_request_str(self):
+        msg = PingRequestMessage()
+        msg.data = b"\xAA\xBB"
+
+        self.assertEqual(str(msg), "PingRequest, data= aabb")
+
+        with self.assertRaises(AttributeError) as _:
+            msg.type = UartCommand.PongResponse
+        self.assertEqual(str(msg), "PingRequest, data= aabb")
 
 
 class PongResponseMessageTests(unittest.TestCase):
@@ -57,8 +175,8 @@ class PongResponseMessageTests(unittest.TestCase):
         msg = PongResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.PongResponse)
-        self.assertEquals(msg.data, b'\xAA')
+        self.assertEqual(msg.type, UartCommand.PongResponse)
+        self.assertEqual(msg.data, b'\xAA')
 
     def test_pong_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\xAB\xAA")
@@ -82,7 +200,7 @@ class PongResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class InitDeviceEventMessageTests(unittest.TestCase):
@@ -96,10 +214,10 @@ class InitDeviceEventMessageTests(unittest.TestCase):
         msg = InitDeviceEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.InitDeviceEvent)
-        self.assertEquals(msg.model_ids[0], expected_model_id_1)
-        self.assertEquals(msg.model_ids[1], expected_model_id_2)
-        self.assertEquals(msg.model_ids[2], expected_model_id_3)
+        self.assertEqual(msg.type, UartCommand.InitDeviceEvent)
+        self.assertEqual(msg.model_ids[0], expected_model_id_1)
+        self.assertEqual(msg.model_ids[1], expected_model_id_2)
+        self.assertEqual(msg.model_ids[2], expected_model_id_3)
 
     def test_init_device_event_deserialize_invalid_len(self):
         stream = io.BytesIO(b"\x07\x03\x01\x10\x03\x10\x08\x10")
@@ -134,7 +252,7 @@ class InitDeviceEventMessageTests(unittest.TestCase):
         msg.model_ids = [input_model_id_1, input_model_id_2, input_model_id_3]
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
     def test_deserialize_real(self):
         stream = io.BytesIO(b"\x14\x03\x01\x10\x03\x10\x08\x10\x02\x13\x11\x13\x00\x11\x01\x11\x00\x13\x0f\x13\x02\x11")
@@ -146,7 +264,76 @@ class InitDeviceEventMessageTests(unittest.TestCase):
         msg = InitDeviceEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.InitDeviceEvent)
+        self.assertEqual(msg.type, UartCommand.InitDeviceEvent)
+
+
+class ModelDescTests(unittest.TestCase):
+    def test_model_desc_pack_into_unpack_from(self):
+        model_desc = ModelDesc(ModelID.SensorSetupServerID)
+        model_desc.config = b"\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55"
+        buf = bytearray(1 + model_desc.get_length())
+
+        offset = model_desc.pack_into(buf, 1)
+        self.assertEqual(offset, len(buf))
+        self.assertEqual(bytes(buf), b"\x00\x01\x11\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55")
+
+        unpacked, offset = ModelDesc.unpack_from(bytes(buf), 1)
+        self.assertEqual(offset, len(buf))
+        self.assertEqual(unpacked, model_desc)
+        self.assertEqual(unpacked.serialized(), bytes(buf[1:]))
+
+    def test_model_desc_unpack_many(self):
+        buf = b"\x00\x01\x10\x01\x11\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55\x00\x13"
+
+        model_descs, offset = ModelDesc.unpack_many(buf, 1, len(buf))
+        self.assertEqual(offset, len(buf))
+        self.assertEqual([model_desc.model_id for model_desc in model_descs],
+                         [ModelID.GenOnOffClientID, ModelID.SensorSetupServerID, ModelID.LightLightnessServerID])
+        self.assertEqual(model_descs[1].config, b"\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55")
+        self.assertEqual(b"".join(model_desc.serialized() for model_desc in model_descs), buf[1:])
+
+    def test_model_desc_unpack_many_truncated_config(self):
+        buf = b"\x00\x01\x10\x01\x11\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55\x00\x13"
+
+        with self.assertRaises(InvalidLen):
+            ModelDesc.unpack_many(buf, 1, len(buf) - 3)
+
+    def test_model_desc_unpack_many_truncated_model_id(self):
+        buf = b"\x00\x01\x10\x00"
+
+        with self.assertRaises(InvalidLen):
+            ModelDesc.unpack_many(buf, 1, len(buf))
+
+    def test_model_desc_serialize_after_update(self):
+        model_desc = ModelDesc(ModelID.GenOnOffClientID)
+        model_desc.config = b"\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55"
+        model_desc.model_id = ModelID.SensorSetupServerID
+
+        stream = io.BytesIO()
+        model_desc.serialize(stream)
+        self.assertEqual(stream.getvalue(), b"\x01\x11\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55")
+
+        model_desc.model_id = ModelID.GenOnOffClientID
+        stream = io.BytesIO()
+        model_desc.serialize(stream)
+        self.assertEqual(stream.getvalue(), b"\x01\x10")
+
+    def test_model_desc_eq(self):
+        config = b"\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55"
+        sensor_setup_1 = ModelDesc(ModelID.SensorSetupServerID)
+        sensor_setup_2 = ModelDesc(ModelID.SensorSetupServerID)
+        sensor_setup_2.config = config
+        client_1 = ModelDesc(ModelID.GenOnOffClientID)
+        client_2 = ModelDesc(ModelID.GenOnOffClientID)
+        client_2.config = config
+
+        self.assertNotEqual(sensor_setup_1, sensor_setup_2)
+        self.assertNotEqual(client_1, sensor_setup_1)
+        self.assertNotEqual(client_1, None)
+        self.assertEqual(client_1, client_2)
+
+        sensor_setup_1.config = config
+        self.assertEqual(sensor_setup_1, sensor_setup_2)
 
 class CreateInstancesRequestTests(unittest.TestCase):
     def test_create_instances_request_deserialize_valid(self):
@@ -163,10 +350,10 @@ class CreateInstancesRequestTests(unittest.TestCase):
         msg = CreateInstancesRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CreateInstancesRequest)
-        self.assertEquals(msg.model_descs[0].model_id, expected_model_desc_1.model_id)
-        self.assertEquals(msg.model_descs[1].model_id, expected_model_desc_2.model_id)
-        self.assertEquals(msg.model_descs[2].model_id, expected_model_desc_3.model_id)
+        self.assertEqual(msg.type, UartCommand.CreateInstancesRequest)
+        self.assertEqual(msg.model_descs[0].model_id, expected_model_desc_1.model_id)
+        self.assertEqual(msg.model_descs[1].model_id, expected_model_desc_2.model_id)
+        self.assertEqual(msg.model_descs[2].model_id, expected_model_desc_3.model_id)
 
     def test_create_instances_request_deserialize_valid_with_config(self):
         stream = io.BytesIO(b"\x0E\x04\x01\x11\x00\x00\x11\x22\x22\x33\x33\x44\x44\x55\x11\x13")
@@ -181,10 +368,10 @@ class CreateInstancesRequestTests(unittest.TestCase):
         msg = CreateInstancesRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CreateInstancesRequest)
-        self.assertEquals(msg.model_descs[0].model_id, expected_model_desc_1.model_id)
-        self.assertEquals(msg.model_descs[0].config, expected_model_desc_1.config)
-        self.assertEquals(msg.model_descs[1].model_id, expected_model_desc_2.model_id)
+        self.assertEqual(msg.type, UartCommand.CreateInstancesRequest)
+        self.assertEqual(msg.model_descs[0].model_id, expected_model_desc_1.model_id)
+        self.assertEqual(msg.model_descs[0].config, expected_model_desc_1.config)
+        self.assertEqual(msg.model_descs[1].model_id, expected_model_desc_2.model_id)
 
     def test_create_instances_request_deserialize_invalid_len(self):
         stream = io.BytesIO(b"\x07\x04\x01\x10\x03\x10\x08\x10")
@@ -200,6 +387,13 @@ class CreateInstancesRequestTests(unittest.TestCase):
         with self.assertRaises(InvalidLen) as _:
             msg.deserialize(stream)
 
+    def test_create_instances_request_deserialize_truncated_config(self):
+        stream = io.BytesIO(b"\x06\x04\x01\x11\x00\x00\x11\x22")
+        msg = CreateInstancesRequestMessage()
+
+        with self.assertRaises(InvalidLen) as _:
+            msg.deserialize(stream)
+
     def test_create_instances_request_deserialize_invalid_model_id(self):
         stream = io.BytesIO(b"\x06\x03\x01\x10\x03\x10\x08\x10")
         msg = CreateInstancesRequestMessage()
@@ -223,7 +417,7 @@ class CreateInstancesRequestTests(unittest.TestCase):
         msg.model_descs = [input_model_id_1, input_model_id_2, input_model_id_3]
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
     def test_create_instances_request_serialize_valid_with_config(self):
         input_model_id_1 = ModelDesc()
@@ -240,7 +434,18 @@ class CreateInstancesRequestTests(unittest.TestCase):
         msg.model_descs = [input_model_id_1, input_model_id_2]
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
+
+    def test_create_instances_request_serialize_length_matches_payload(self):
+        model_desc = ModelDesc()
+        model_desc.model_id = 0x1001
+        model_desc.config = b"\x00\x00"
+
+        msg = CreateInstancesRequestMessage()
+        msg.model_descs = [model_desc]
+
+        self.assertEqual(msg.serialize_to_bytes(), b"\x02\x04\x01\x10")
+        self.assertEqual(msg.get_length(), len(msg.serialize_to_bytes()) - 2)
 
 
 class CreateInstancesResponseTests(unittest.TestCase):
@@ -254,10 +459,10 @@ class CreateInstancesResponseTests(unittest.TestCase):
         msg = CreateInstancesResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CreateInstancesResponse)
-        self.assertEquals(msg.model_ids[0], expected_model_id_1)
-        self.assertEquals(msg.model_ids[1], expected_model_id_2)
-        self.assertEquals(msg.model_ids[2], expected_model_id_3)
+        self.assertEqual(msg.type, UartCommand.CreateInstancesResponse)
+        self.assertEqual(msg.model_ids[0], expected_model_id_1)
+        self.assertEqual(msg.model_ids[1], expected_model_id_2)
+        self.assertEqual(msg.model_ids[2], expected_model_id_3)
 
     def test_create_instances_response_deserialize_invalid_len(self):
         stream = io.BytesIO(b"\x07\x05\x01\x10\x03\x10\x08\x10")
@@ -292,7 +497,7 @@ class CreateInstancesResponseTests(unittest.TestCase):
         msg.model_ids = [input_model_id_1, input_model_id_2, input_model_id_3]
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
     def test_deserialize_real(self):
         stream = io.BytesIO(b"\x14\x05\x01\x10\x03\x10\x08\x10\x02\x13\x11\x13\x00\x11\x01\x11\x00\x13\x0f\x13\x02\x11")
@@ -304,7 +509,7 @@ class CreateInstancesResponseTests(unittest.TestCase):
         msg = CreateInstancesResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CreateInstancesResponse)
+        self.assertEqual(msg.type, UartCommand.CreateInstancesResponse)
 
 
 class InitNodeEventMessageTests(unittest.TestCase):
@@ -318,10 +523,10 @@ class InitNodeEventMessageTests(unittest.TestCase):
         msg = InitNodeEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.InitNodeEvent)
-        self.assertEquals(msg.model_ids[0], expected_model_id_1)
-        self.assertEquals(msg.model_ids[1], expected_model_id_2)
-        self.assertEquals(msg.model_ids[2], expected_model_id_3)
+        self.assertEqual(msg.type, UartCommand.InitNodeEvent)
+        self.assertEqual(msg.model_ids[0], expected_model_id_1)
+        self.assertEqual(msg.model_ids[1], expected_model_id_2)
+        self.assertEqual(msg.model_ids[2], expected_model_id_3)
 
     def test_init_node_event_deserialize_invalid_len(self):
         stream = io.BytesIO(b"\x07\x06\x01\x10\x03\x10\x08\x10")
@@ -356,7 +561,45 @@ class InitNodeEventMessageTests(unittest.TestCase):
         msg.model_ids = [input_model_id_1, input_model_id_2, input_model_id_3]
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
+
+    def test_init_node_event_str(self):
+        msg = InitNodeEventMessage()
+        msg.model_ids = [ModelID.GenOnOffClientID, ModelID.SensorSetupServerID]
+
+        self.assertEqual(str(msg), "InitNodeEvent, model_ids= 0x1001 GenOnOffClientID, 0x1101 SensorSetupServerID, ")
+
+    def test_init_node_event_serialize_array(self):
+        msg = InitNodeEventMessage()
+        msg.model_ids = array.array('H', [0x1001, 0x1101])
+
+        self.assertEqual(msg.serialize_to_bytes(), b"\x04\x06\x01\x10\x01\x11")
+        self.assertEqual(str(msg), "InitNodeEvent, model_ids= 0x1001 GenOnOffClientID, 0x1101 SensorSetupServerID, ")
+
+    def test_init_node_event_serialize_deserialize_max_model_ids(self):
+        model_ids = [ModelID.GenOnOffClientID, ModelID.SensorSetupServerID] * 63 + [ModelID.LightLCClientID]
+        stream = io.BytesIO()
+
+        msg = InitNodeEventMessage()
+        msg.model_ids = model_ids
+        msg.serialize(stream)
+
+        self.assertEqual(stream.getvalue()[:4], b"\xFE\x06\x01\x10")
+        self.assertEqual(len(stream.getvalue()), 256)
+
+        stream.seek(0)
+        msg = InitNodeEventMessage()
+        msg.deserialize(stream)
+
+        self.assertEqual(msg.model_ids, model_ids)
+
+    def test_init_node_event_serialize_empty(self):
+        stream = io.BytesIO()
+
+        msg = InitNodeEventMessage()
+        msg.serialize(stream)
+
+        self.assertEqual(stream.getvalue(), b"\x00\x06")
 
 
 class MeshMessageRequestMessageTests(unittest.TestCase):
@@ -366,11 +609,18 @@ class MeshMessageRequestMessageTests(unittest.TestCase):
         msg = MeshMessageRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.MeshMessageRequest)
-        self.assertEquals(msg.instance_index, 0xAA)
-        self.assertEquals(msg.sub_index, 0xBB)
-        self.assertEquals(msg.mesh_opcode, 0xDDCC)
-        self.assertEquals(msg.mesh_command, b"\x12\x34")
+        self.assertEqual(msg.type, UartCommand.MeshMessageRequest)
+        self.assertEqual(msg.instance_index, 0xAA)
+        self.assertEqual(msg.sub_index, 0xBB)
+        self.assertEqual(msg.mesh_opcode, 0xDDCC)
+        self.assertEqual(msg.mesh_command, b"\x12\x34")
+
+    def test_mesh_message_request_str(self):
+        msg = MeshMessageRequestMessage()
+        msg.deserialize(io.BytesIO(b"\x06\x07\xAA\xBB\xCC\xDD\x12\x34"))
+
+        self.assertEqual(str(msg), "MeshMessageRequest, instance_index=170, sub_index=187, mesh_opcode=56780"
+                                   ", mesh_command=1234")
 
     def test_mesh_message_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x06\x09\xAA\xBB\xCC\xDD\x12\x34")
@@ -386,6 +636,13 @@ class MeshMessageRequestMessageTests(unittest.TestCase):
         with self.assertRaises(InvalidLen) as _:
             msg.deserialize(stream)
 
+    def test_mesh_message_request_deserialize_truncated_fields(self):
+        stream = io.BytesIO(b"\x04\x07\xAA")
+        msg = MeshMessageRequestMessage()
+
+        with self.assertRaises(InvalidLen) as _:
+            msg.deserialize(stream)
+
     def test_mesh_message_request_serialize_valid(self):
         msg = MeshMessageRequestMessage()
         msg.instance_index = 0xAA
@@ -397,7 +654,7 @@ class MeshMessageRequestMessageTests(unittest.TestCase):
         msg.serialize(stream)
 
         expected_output = b"\x06\x07\xAA\xBB\xCC\xDD\x12\x34"
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class StartNodeRequestMessageTests(unittest.TestCase):
@@ -407,7 +664,7 @@ class StartNodeRequestMessageTests(unittest.TestCase):
         msg = StartNodeRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.StartNodeRequest)
+        self.assertEqual(msg.type, UartCommand.StartNodeRequest)
 
     def test_start_node_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -430,7 +687,7 @@ class StartNodeRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class StartNodeResponseMessageTests(unittest.TestCase):
@@ -440,7 +697,7 @@ class StartNodeResponseMessageTests(unittest.TestCase):
         msg = StartNodeResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.StartNodeResponse)
+        self.assertEqual(msg.type, UartCommand.StartNodeResponse)
 
     def test_start_node_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -463,7 +720,7 @@ class StartNodeResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class FactoryResetRequestMessageTests(unittest.TestCase):
@@ -473,7 +730,7 @@ class FactoryResetRequestMessageTests(unittest.TestCase):
         msg = FactoryResetRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.FactoryResetRequest)
+        self.assertEqual(msg.type, UartCommand.FactoryResetRequest)
 
     def test_factory_reset_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -496,7 +753,7 @@ class FactoryResetRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class FactoryResetResponseMessageTests(unittest.TestCase):
@@ -506,7 +763,7 @@ class FactoryResetResponseMessageTests(unittest.TestCase):
         msg = FactoryResetResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.FactoryResetResponse)
+        self.assertEqual(msg.type, UartCommand.FactoryResetResponse)
 
     def test_factory_reset_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -529,7 +786,7 @@ class FactoryResetResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class FactoryResetEventMessageTests(unittest.TestCase):
@@ -539,7 +796,7 @@ class FactoryResetEventMessageTests(unittest.TestCase):
         msg = FactoryResetEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.FactoryResetEvent)
+        self.assertEqual(msg.type, UartCommand.FactoryResetEvent)
 
     def test_factory_reset_event_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -562,7 +819,7 @@ class FactoryResetEventMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class MeshMessageResponseMessageTests(unittest.TestCase):
@@ -572,9 +829,9 @@ class MeshMessageResponseMessageTests(unittest.TestCase):
         msg = MeshMessageResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.MeshMessageResponse)
-        self.assertEquals(msg.instance_index, 0x01)
-        self.assertEquals(msg.sub_index, 0x02)
+        self.assertEqual(msg.type, UartCommand.MeshMessageResponse)
+        self.assertEqual(msg.instance_index, 0x01)
+        self.assertEqual(msg.sub_index, 0x02)
 
     def test_mesh_message_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x02\xAB\x01")
@@ -606,7 +863,7 @@ class MeshMessageResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class CurrentStateRequestMessageTests(unittest.TestCase):
@@ -616,7 +873,7 @@ class CurrentStateRequestMessageTests(unittest.TestCase):
         msg = CurrentStateRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CurrentStateRequest)
+        self.assertEqual(msg.type, UartCommand.CurrentStateRequest)
 
     def test_current_state_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -639,7 +896,7 @@ class CurrentStateRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class CurrentStateResponseMessageTests(unittest.TestCase):
@@ -649,8 +906,8 @@ class CurrentStateResponseMessageTests(unittest.TestCase):
         msg = CurrentStateResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.CurrentStateResponse)
-        self.assertEquals(msg.state, ModemState.Device)
+        self.assertEqual(msg.type, UartCommand.CurrentStateResponse)
+        self.assertEqual(msg.state, ModemState.Device)
 
     def test_current_state_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\xAB\x01")
@@ -666,6 +923,13 @@ class CurrentStateResponseMessageTests(unittest.TestCase):
         with self.assertRaises(InvalidLen) as _:
             msg.deserialize(stream)
 
+    def test_current_state_response_deserialize_invalid_state(self):
+        stream = io.BytesIO(b"\x01\x11\xAB")
+        msg = CurrentStateResponseMessage()
+
+        with self.assertRaises(ValueError) as _:
+            msg.deserialize(stream)
+
     def test_current_state_response_serialize_valid(self):
         msg = CurrentStateResponseMessage()
         msg.state = ModemState.InitNode
@@ -674,7 +938,7 @@ class CurrentStateResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class ErrorMessageTests(unittest.TestCase):
@@ -684,8 +948,8 @@ class ErrorMessageTests(unittest.TestCase):
         msg = ErrorMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.Error)
-        self.assertEquals(msg.error, Error.InvalidCMD)
+        self.assertEqual(msg.type, UartCommand.Error)
+        self.assertEqual(msg.error, Error.InvalidCMD)
 
     def test_error_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\xAB\x01")
@@ -709,7 +973,24 @@ class ErrorMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
+
+    def test_error_unpack_records_valid(self):
+        records = ErrorMessage.unpack_records(b"\x01\x12\x01\x01\x12\x02")
+
+        self.assertEqual([(Error.InvalidCMD,), (Error.InvalidLen,)], records)
+
+    def test_error_unpack_records_invalid_opcode(self):
+        with self.assertRaises(InvalidOpcode) as _:
+            ErrorMessage.unpack_records(b"\x01\x12\x01\x01\xAB\x02")
+
+    def test_error_unpack_records_invalid_too_short(self):
+        with self.assertRaises(InvalidLen) as _:
+            ErrorMessage.unpack_records(b"\x01\x12\x01\x01\x12")
+
+    def test_unpack_records_not_fixed_layout(self):
+        with self.assertRaises(TypeError) as _:
+            MeshMessageRequestMessage.unpack_records(b"")
 
 
 class FirmwareVersionRequestMessageTests(unittest.TestCase):
@@ -719,7 +1000,7 @@ class FirmwareVersionRequestMessageTests(unittest.TestCase):
         msg = FirmwareVersionRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.FirmwareVersionRequest)
+        self.assertEqual(msg.type, UartCommand.FirmwareVersionRequest)
 
     def test_firmware_version_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -742,7 +1023,7 @@ class FirmwareVersionRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class FirmwareVersionResponseMessageTests(unittest.TestCase):
@@ -752,8 +1033,8 @@ class FirmwareVersionResponseMessageTests(unittest.TestCase):
         msg = FirmwareVersionResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.FirmwareVersionResponse)
-        self.assertEquals(msg.firmware_version, b"\x01\x02\x03\x04\x05")
+        self.assertEqual(msg.type, UartCommand.FirmwareVersionResponse)
+        self.assertEqual(msg.firmware_version, b"\x01\x02\x03\x04\x05")
 
     def test_firmware_version_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x05\x10\x01\x02\x03\x04\x05")
@@ -769,6 +1050,12 @@ class FirmwareVersionResponseMessageTests(unittest.TestCase):
         with self.assertRaises(InvalidLen) as _:
             msg.deserialize(stream)
 
+    def test_firmware_version_response_deserialize_truncated(self):
+        msg = FirmwareVersionResponseMessage()
+
+        with self.assertRaises(InvalidLen) as _:
+            msg.deserialize_from_buffer(b"\x05\x14ab")
+
     def test_firmware_version_response_serialize_valid(self):
         msg = FirmwareVersionResponseMessage()
         msg.firmware_version = b"\x01\x02\x03\x04\x05"
@@ -777,7 +1064,7 @@ class FirmwareVersionResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class SensorUpdateRequestMessageTests(unittest.TestCase):
@@ -787,10 +1074,10 @@ class SensorUpdateRequestMessageTests(unittest.TestCase):
         msg = SensorUpdateRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.SensorUpdateRequest)
-        self.assertEquals(msg.instance_index, 0xAA)
-        self.assertEquals(msg.property_id, 0xCCBB)
-        self.assertEquals(msg.data, b"\x12\x34\x45")
+        self.assertEqual(msg.type, UartCommand.SensorUpdateRequest)
+        self.assertEqual(msg.instance_index, 0xAA)
+        self.assertEqual(msg.property_id, 0xCCBB)
+        self.assertEqual(msg.data, b"\x12\x34\x45")
 
     def test_sensor_update_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x06\x16\xAA\xBB\xCC\x12\x34\x45")
@@ -816,7 +1103,7 @@ class SensorUpdateRequestMessageTests(unittest.TestCase):
         msg.serialize(stream)
 
         expected_output = b"\x06\x15\xAA\xBB\xCC\x12\x34\x45"
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class AttentionEventMessageTests(unittest.TestCase):
@@ -826,8 +1113,8 @@ class AttentionEventMessageTests(unittest.TestCase):
         msg = AttentionEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.AttentionEvent)
-        self.assertEquals(msg.attention, AttentionEvent.On)
+        self.assertEqual(msg.type, UartCommand.AttentionEvent)
+        self.assertEqual(msg.attention, AttentionEvent.On)
 
     def test_attention_event_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\x17\x01")
@@ -858,7 +1145,7 @@ class AttentionEventMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class SoftResetRequestMessageTests(unittest.TestCase):
@@ -868,7 +1155,7 @@ class SoftResetRequestMessageTests(unittest.TestCase):
         msg = SoftResetRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.SoftResetRequest)
+        self.assertEqual(msg.type, UartCommand.SoftResetRequest)
 
     def test_soft_reset_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -891,7 +1178,7 @@ class SoftResetRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class SoftResetResponseMessageTests(unittest.TestCase):
@@ -901,7 +1188,7 @@ class SoftResetResponseMessageTests(unittest.TestCase):
         msg = SoftResetResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.SoftResetResponse)
+        self.assertEqual(msg.type, UartCommand.SoftResetResponse)
 
     def test_soft_reset_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -924,7 +1211,7 @@ class SoftResetResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class SensorUpdateResponseMessageTests(unittest.TestCase):
@@ -934,7 +1221,7 @@ class SensorUpdateResponseMessageTests(unittest.TestCase):
         msg = SensorUpdateResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.SensorUpdateResponse)
+        self.assertEqual(msg.type, UartCommand.SensorUpdateResponse)
 
     def test_sensor_update_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -957,7 +1244,7 @@ class SensorUpdateResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DeviceUUIDRequestMessageTests(unittest.TestCase):
@@ -967,7 +1254,7 @@ class DeviceUUIDRequestMessageTests(unittest.TestCase):
         msg = DeviceUUIDRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DeviceUUIDRequest)
+        self.assertEqual(msg.type, UartCommand.DeviceUUIDRequest)
 
     def test_device_uuid_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\xAB")
@@ -990,7 +1277,7 @@ class DeviceUUIDRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DeviceUUIDResponseMessageTests(unittest.TestCase):
@@ -1000,8 +1287,8 @@ class DeviceUUIDResponseMessageTests(unittest.TestCase):
         msg = DeviceUUIDResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DeviceUUIDResponse)
-        self.assertEquals(msg.uuid, b"\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB")
+        self.assertEqual(msg.type, UartCommand.DeviceUUIDResponse)
+        self.assertEqual(msg.uuid, b"\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB")
 
     def test_device_uuid_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x10\x1A\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB\xAB")
@@ -1039,32 +1326,24 @@ class DeviceUUIDResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuInitRequestMessageTests(unittest.TestCase):
+    firmware_sha256 = b"\xAA" * 32
+    dfu_init_request_frame = b"\x28\x80\x00\x11\x22\x33" + firmware_sha256 + b"\x03\xAA\xBB\xCC"
+
     def test_dfu_init_request_deserialize_valid(self):
-        stream = io.BytesIO(b"\x28" + \
-                            b"\x80" + \
-                            b"\x00\x11\x22\x33" + \
-                            b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                            b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                            b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                            b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                            b"\x03\xAA\xBB\xCC")
+        stream = io.BytesIO(self.dfu_init_request_frame)
 
         msg = DfuInitRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuInitRequest)
-        self.assertEquals(msg.firmware_size, 0x33221100)
-        self.assertEquals(msg.firmware_sha256,
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA")
-        self.assertEquals(msg.app_data_length, 0x03)
-        self.assertEquals(msg.app_data, b"\xAA\xBB\xCC")
+        self.assertEqual(msg.type, UartCommand.DfuInitRequest)
+        self.assertEqual(msg.firmware_size, 0x33221100)
+        self.assertEqual(msg.firmware_sha256, self.firmware_sha256)
+        self.assertEqual(msg.app_data_length, 0x03)
+        self.assertEqual(msg.app_data, b"\xAA\xBB\xCC")
 
     def test_dfu_init_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x0C\x70\x00\x11\x22\x33\x00\x11\x22\x33\x03\xAA\xBB\xCC")
@@ -1090,25 +1369,15 @@ class DfuInitRequestMessageTests(unittest.TestCase):
     def test_dfu_init_request_serialize_valid(self):
         msg = DfuInitRequestMessage()
         msg.firmware_size = 0x33221100
-        msg.firmware_sha256 = b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                              b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                              b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                              b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA"
+        msg.firmware_sha256 = self.firmware_sha256
         msg.app_data_length = 0x03
         msg.app_data = b"\xAA\xBB\xCC"
 
         stream = io.BytesIO()
         msg.serialize(stream)
 
-        expected_output = b"\x28" + \
-                          b"\x80" + \
-                          b"\x00\x11\x22\x33" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\xAA\xAA\xAA\xAA\xAA\xAA\xAA\xAA" + \
-                          b"\x03\xAA\xBB\xCC"
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(self.dfu_init_request_frame, stream.getvalue())
+        self.assertEqual(self.dfu_init_request_frame, msg.serialize_to_bytes())
 
 
 class DfuInitResponseMessageTests(unittest.TestCase):
@@ -1118,8 +1387,8 @@ class DfuInitResponseMessageTests(unittest.TestCase):
         msg = DfuInitResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuInitResponse)
-        self.assertEquals(msg.status, DFUStatus.DFU_SUCCESS)
+        self.assertEqual(msg.type, UartCommand.DfuInitResponse)
+        self.assertEqual(msg.status, DFUStatus.DFU_SUCCESS)
 
     def test_dfu_init_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\x83\x01")
@@ -1150,7 +1419,7 @@ class DfuInitResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuStateRequestMessageTests(unittest.TestCase):
@@ -1160,7 +1429,7 @@ class DfuStateRequestMessageTests(unittest.TestCase):
         msg = DfuStatusRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuStatusRequest)
+        self.assertEqual(msg.type, UartCommand.DfuStatusRequest)
 
     def test_dfu_state_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\x17")
@@ -1183,7 +1452,7 @@ class DfuStateRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuStateResponseMessageTests(unittest.TestCase):
@@ -1193,11 +1462,11 @@ class DfuStateResponseMessageTests(unittest.TestCase):
         msg = DfuStatusResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuStatusResponse)
-        self.assertEquals(msg.status, DFUStatus.DFU_SUCCESS)
-        self.assertEquals(msg.supported_page_size, 0x78563412)
-        self.assertEquals(msg.firmware_offset, 0x78563412)
-        self.assertEquals(msg.firmware_crc, 0x78563412)
+        self.assertEqual(msg.type, UartCommand.DfuStatusResponse)
+        self.assertEqual(msg.status, DFUStatus.DFU_SUCCESS)
+        self.assertEqual(msg.supported_page_size, 0x78563412)
+        self.assertEqual(msg.firmware_offset, 0x78563412)
+        self.assertEqual(msg.firmware_crc, 0x78563412)
 
     def test_dfu_state_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x0D\x84\x01\x12\x34\x56\x78\x12\x34\x56\x78\x12\x34\x56\x78")
@@ -1231,7 +1500,22 @@ class DfuStateResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
+
+    def test_dfu_status_response_verify_firmware(self):
+        msg = DfuStatusResponseMessage()
+        msg.firmware_offset = 9
+        msg.firmware_crc = 0xCBF43926
+
+        self.assertTrue(msg.verify_firmware(b"123456789ABC"))
+        self.assertFalse(msg.verify_firmware(b"12345678ABCD"))
+
+    def test_dfu_status_response_verify_firmware_array(self):
+        msg = DfuStatusResponseMessage()
+        msg.firmware_offset = 9
+        msg.firmware_crc = 0xCBF43926
+
+        self.assertTrue(msg.verify_firmware(array.array('H', b"123456789ABC")))
 
 
 class DfuPageCreateRequestMessageTests(unittest.TestCase):
@@ -1241,8 +1525,8 @@ class DfuPageCreateRequestMessageTests(unittest.TestCase):
         msg = DfuPageCreateRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuPageCreateRequest)
-        self.assertEquals(msg.requested_page_size, 0xDDCCBBAA)
+        self.assertEqual(msg.type, UartCommand.DfuPageCreateRequest)
+        self.assertEqual(msg.requested_page_size, 0xDDCCBBAA)
 
     def test_dfu_page_create_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x04\x85\xAA\xBB\xCC\xDD")
@@ -1273,7 +1557,7 @@ class DfuPageCreateRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuPageCreateResponseMessageTests(unittest.TestCase):
@@ -1283,8 +1567,8 @@ class DfuPageCreateResponseMessageTests(unittest.TestCase):
         msg = DfuPageCreateResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuPageCreateResponse)
-        self.assertEquals(msg.status, DFUStatus.DFU_SUCCESS)
+        self.assertEqual(msg.type, UartCommand.DfuPageCreateResponse)
+        self.assertEqual(msg.status, DFUStatus.DFU_SUCCESS)
 
     def test_dfu_page_create_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\x83\x01")
@@ -1315,7 +1599,7 @@ class DfuPageCreateResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuWriteDataEventMessageTests(unittest.TestCase):
@@ -1325,9 +1609,9 @@ class DfuWriteDataEventMessageTests(unittest.TestCase):
         msg = DfuWriteDataEventMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuWriteDataEvent)
-        self.assertEquals(msg.data_len, 0x03)
-        self.assertEquals(msg.data, b"\xAA\xBB\xCC")
+        self.assertEqual(msg.type, UartCommand.DfuWriteDataEvent)
+        self.assertEqual(msg.data_len, 0x03)
+        self.assertEqual(msg.data, b"\xAA\xBB\xCC")
 
     def test_dfu_write_data_event_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x04\x85\x03\xAA\xBB\xCC")
@@ -1359,7 +1643,7 @@ class DfuWriteDataEventMessageTests(unittest.TestCase):
         msg.serialize(stream)
 
         expected_output = b"\x04\x86\x03\xAA\xBB\xCC"
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuPageStoreRequestMessageTests(unittest.TestCase):
@@ -1369,7 +1653,7 @@ class DfuPageStoreRequestMessageTests(unittest.TestCase):
         msg = DfuPageStoreRequestMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuPageStoreRequest)
+        self.assertEqual(msg.type, UartCommand.DfuPageStoreRequest)
 
     def test_dfu_page_store_request_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x00\x17")
@@ -1392,7 +1676,7 @@ class DfuPageStoreRequestMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
 
 
 class DfuPageStoreResponseMessageTests(unittest.TestCase):
@@ -1402,8 +1686,8 @@ class DfuPageStoreResponseMessageTests(unittest.TestCase):
         msg = DfuPageStoreResponseMessage()
         msg.deserialize(stream)
 
-        self.assertEquals(msg.type, UartCommand.DfuPageStoreResponse)
-        self.assertEquals(msg.status, DFUStatus.DFU_SUCCESS)
+        self.assertEqual(msg.type, UartCommand.DfuPageStoreResponse)
+        self.assertEqual(msg.status, DFUStatus.DFU_SUCCESS)
 
     def test_dfu_page_store_response_deserialize_invalid_opcode(self):
         stream = io.BytesIO(b"\x01\x83\x01")
@@ -1434,4 +1718,4 @@ class DfuPageStoreResponseMessageTests(unittest.TestCase):
 
         msg.serialize(stream)
 
-        self.assertEquals(expected_output, stream.getvalue())
+        self.assertEqual(expected_output, stream.getvalue())
@@ -1,6 +1,9 @@
+import queue
+import threading
+import time
 import unittest
 
-from silvair_uart_common_libs.uart_common_classes import UartAdapter
+from silvair_uart_common_libs.uart_common_classes import UartAdapter, UartConnectionThread
 
 
 class TestUartClass(unittest.TestCase):
@@ -20,4 +23,175 @@ class TestUartClass(unittest.TestCase):
 
     def test_empty_buffer_is_processed(self):
         self.assertEqual(UartAdapter.extract_frames(bytearray()),
-                         ([], bytearray()))
\ No newline at end of file
+                         ([], bytearray()))
+
+    def test_crc_bytes_of_payload(self):
+        self.assertEqual(UartAdapter.calculate_crc_bytes(self.valid_full_frame_payload), bytes.fromhex("DB88"))
+
+    def test_crc_of_memoryview_payload(self):
+        self.assertEqual(UartAdapter.calculate_crc(memoryview(self.valid_full_frame_payload)),
+                         UartAdapter.calculate_crc(self.valid_full_frame_payload))
+
+    def test_frame_after_invalid_crc_frame_is_parsed(self):
+        self.assertEqual(UartAdapter.extract_frames(bytes.fromhex("AA55010122DB89") + self.valid_full_frame_bytes_with_data),
+                         ([self.valid_full_frame_payload], bytearray()))
+
+    def test_frame_after_orphaned_bytes_is_parsed(self):
+        with self.assertLogs("silvair_uart_common_libs.uart_common_classes", "WARNING"):
+            self.assertEqual(UartAdapter.extract_frames(self.valid_full_frame_bytes_with_data + bytes.fromhex("0102") +
+                                                        self.valid_full_frame_bytes_with_data),
+                             ([self.valid_full_frame_payload, self.valid_full_frame_payload], bytearray()))
+
+    def test_data_without_preamble_is_consumed(self):
+        with self.assertLogs("silvair_uart_common_libs.uart_common_classes", "WARNING"):
+            self.assertEqual(UartAdapter.extract_frames(bytes.fromhex("010203")), ([], bytearray()))
+
+    def test_trailing_preamble_byte_is_kept(self):
+        with self.assertLogs("silvair_uart_common_libs.uart_common_classes", "WARNING"):
+            self.assertEqual(UartAdapter.extract_frames(bytes.fromhex("0102AA")), ([], bytearray.fromhex("AA")))
+
+    def test_orphaned_bytes_before_frame_are_removed(self):
+        with self.assertLogs("silvair_uart_common_libs.uart_common_classes", "WARNING") as logs:
+            self.assertEqual(UartAdapter.extract_frames(bytearray.fromhex("0102") +
+                                                        self.valid_full_frame_bytes_with_data),
+                             ([self.valid_full_frame_payload], bytearray()))
+        self.assertEqual(len(logs.records), 1)
+
+    def test_eat_bytes_until_preamble_trims_given_buffer(self):
+        buffer_data = bytearray.fromhex("0102") + self.valid_full_frame_bytes_with_data
+
+        with self.assertLogs("silvair_uart_common_libs.uart_common_classes", "WARNING"):
+            self.assertIs(UartAdapter.eat_bytes_until_preamble(buffer_data), buffer_data)
+        self.assertEqual(buffer_data, self.valid_full_frame_bytes_with_data)
+
+
+class FakeSerial:
+    """
+    Serial port stand-in, which stops connection thread after reads_n reads. Writes return write_results in turn
+    """
+
+    def __init__(self, timeout, write_results=(), reads_n=1):
+        self.timeout = timeout
+        self.in_waiting = 0
+        self.thread = None
+        self.written_data = bytearray()
+        self.write_results = list(write_results)
+        self.reads_n = reads_n
+        self.read_timeouts = []
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def write(self, data):
+        sent_bytes_n = self.write_results.pop(0)
+        self.written_data += data if sent_bytes_n is None else data[:sent_bytes_n]
+        return sent_bytes_n
+
+    def read(self, size):
+        self.read_timeouts.append(self.timeout)
+        self.reads_n -= 1
+        if self.reads_n == 0:
+            self.thread._serial_busy.clear()
+        return b""
+
+
+class BlockingFakeSerial:
+    """
+    Serial port stand-in, which blocks in read for its whole timeout unless read is cancelled
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.in_waiting = 0
+        self.read_cancelled = threading.Event()
+        self.written = threading.Event()
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def write(self, data):
+        self.written.set()
+        return len(data)
+
+    def read(self, size):
+        self.read_cancelled.wait(self.timeout)
+        self.read_cancelled.clear()
+        return b""
+
+
+class CancellableFakeSerial(BlockingFakeSerial):
+    """
+    Blocking serial port stand-in with cancel_read
+    """
+
+    def cancel_read(self):
+        self.read_cancelled.set()
+
+
+class TestUartConnectionThreadSendLatency(unittest.TestCase):
+    def measure_send_latency(self, fake_serial, wake_up, thread_class=UartConnectionThread):
+        out_queue = queue.Queue()
+        thread = thread_class(fake_serial, queue.Queue(), out_queue)
+        thread.start()
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        out_queue.put(b"\x01")
+        if wake_up:
+            thread.wake_up()
+        self.assertTrue(fake_serial.written.wait(1))
+        latency = time.monotonic() - start
+
+        thread.stop()
+        return latency
+
+    def test_long_timeout_does_not_delay_sending(self):
+        self.assertLess(self.measure_send_latency(BlockingFakeSerial(0.5), wake_up=False), 0.1)
+
+    def test_wake_up_sends_before_read_timeout(self):
+        class LongReadTimeoutThread(UartConnectionThread):
+            READ_TIMEOUT_S = 0.5
+
+        latency = self.measure_send_latency(CancellableFakeSerial(0.5), wake_up=True,
+                                            thread_class=LongReadTimeoutThread)
+        self.assertLess(latency, 0.1)
+
+
+class TestUartConnectionThread(unittest.TestCase):
+    def run_thread(self, timeout, data_to_be_sent=(), write_results=(), reads_n=1):
+        out_queue = queue.Queue()
+        for data in data_to_be_sent:
+            out_queue.put(data)
+
+        fake_serial = FakeSerial(timeout, write_results, reads_n)
+        fake_serial.thread = UartConnectionThread(fake_serial, queue.Queue(), out_queue)
+        fake_serial.thread.run()
+        return fake_serial
+
+    def test_long_timeout_is_capped_while_running(self):
+        fake_serial = self.run_thread(0.5)
+        self.assertEqual(fake_serial.read_timeouts, [UartConnectionThread.READ_TIMEOUT_S])
+        self.assertEqual(fake_serial.timeout, 0.5)
+
+    def test_short_timeout_is_kept(self):
+        fake_serial = self.run_thread(UartConnectionThread.READ_TIMEOUT_S / 2)
+        self.assertEqual(fake_serial.read_timeouts, [UartConnectionThread.READ_TIMEOUT_S / 2])
+
+    def test_missing_timeout_is_replaced_while_running(self):
+        fake_serial = self.run_thread(0)
+        self.assertEqual(fake_serial.read_timeouts, [UartConnectionThread.READ_TIMEOUT_S])
+        self.assertEqual(fake_serial.timeout, 0)
+
+    def test_partially_written_data_is_sent_in_order(self):
+        fake_serial = self.run_thread(0.5, [b"\x01\x02\x03", b"\x04\x05"], write_results=[2, 1, 2], reads_n=3)
+        self.assertEqual(fake_serial.written_data, b"\x01\x02\x03\x04\x05")
+
+    def test_write_without_written_bytes_count_sends_whole_buffer(self):
+        fake_serial = self.run_thread(0.5, [b"\x01\x02\x03"], write_results=[None], reads_n=2)
+        self.assertEqual(fake_serial.written_data, b"\x01\x02\x03")